@@ -0,0 +1,112 @@
+"""
+Phrase Matcher Module - Shared Keyword Scanning
+===============================================
+Finds which of a fixed set of phrases occur in a piece of text. Used for
+both wake-word detection and skill keyword dispatch, which run on every
+transcription.
+
+Key Features:
+- Built once per phrase set, reused for every scan
+- Aho-Corasick automaton when pyahocorasick is installed
+- Lookahead regex fallback with the same results
+- Longest-match lookup and phrase removal
+"""
+
+from typing import Iterable, Iterator, Optional, Tuple
+import re
+
+# Optional: pyahocorasick finds every phrase in one linear pass over the
+# text, however many phrases there are (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# ============================================================================
+# PHRASE MATCHER
+# ============================================================================
+class PhraseMatcher:
+    """
+    Compiled matcher for a set of lowercase phrases.
+
+    Texts passed to the matcher are expected to be lowercase already, as
+    callers normally have the lowered command at hand.
+    """
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        """
+        Compile the phrases.
+
+        Args:
+            phrases: Phrases to look for (lowercased, empty ones ignored)
+        """
+        # Longest first, so alternations prefer "hey jarvis" over "jarvis"
+        self.phrases: Tuple[str, ...] = tuple(sorted(
+            dict.fromkeys(p.lower() for p in phrases if p), key=len, reverse=True))
+
+        alternation = "|".join(map(re.escape, self.phrases)) or "(?!)"
+        self._pattern = re.compile(alternation)
+
+        # The lookahead reports the longest phrase starting at every
+        # position, overlaps included, in one scan
+        self._lookahead = re.compile(f"(?=({alternation}))")
+
+        self._automaton = None
+        if ahocorasick is not None and self.phrases:
+            automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @classmethod
+    def build(cls, phrases: Iterable[str]) -> "PhraseMatcher":
+        """
+        Build a matcher for the given phrases.
+
+        Args:
+            phrases: Phrases to look for
+
+        Returns:
+            Compiled PhraseMatcher
+        """
+        return cls(phrases)
+
+    def iter_matches(self, text: str) -> Iterator[str]:
+        """
+        Iterate over the phrases contained in the text.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            Iterator over matched phrases, in order of position
+        """
+        if self._automaton is not None:
+            return (phrase for _, phrase in self._automaton.iter(text))
+        return (match.group(1) for match in self._lookahead.finditer(text))
+
+    def match_longest(self, text: str) -> Optional[str]:
+        """
+        Find the longest phrase contained in the text.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            The longest matching phrase, or None if nothing matches
+        """
+        return max(self.iter_matches(text), key=len, default=None)
+
+    def remove(self, text: str) -> str:
+        """
+        Remove every occurrence of the phrases from the text.
+
+        Args:
+            text: Lowercase text
+
+        Returns:
+            Text with the phrases removed (whitespace is left as is)
+        """
+        return self._pattern.sub("", text)
@@ -9,20 +9,165 @@ Key Features:
 - Conversation history management
 - Context-aware responses
 - Error handling and retry logic
-- Response streaming support
+- Response streaming support (chat_stream)
 - Token management
 """
 
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import Future
+from itertools import accumulate
+from typing import List, Dict, Any, Deque, Iterable, Iterator, Optional
+import asyncio
+import bisect
+import json
 import logging
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import uuid
 import ollama
 import config
+from brain_server import get_broker
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# TOKEN BUDGET
+# ============================================================================
+# History is trimmed once the estimated context exceeds this fraction
+# of config.CONTEXT_TOKEN_BUDGET
+_CONTEXT_TRIM_RATIO = 0.8
+
+# Fixed per-message overhead (role markers, separators) added to estimates
+_MESSAGE_TOKEN_OVERHEAD = 8
+
+# Maximum number of evicted messages written to the archive per write() call
+_ARCHIVE_BATCH_SIZE = 64
+
+def _message_content(response: Any) -> str:
+    """
+    Extract the message text from an Ollama chat response or stream chunk.
+
+    Uses direct subscripting, which works for both the plain dicts returned
+    by older ollama-python releases and the newer ChatResponse objects.
+
+    Args:
+        response: Chat response or streamed chunk
+
+    Returns:
+        Message content, or an empty string if the response has none
+    """
+    try:
+        return response["message"]["content"] or ""
+    except (KeyError, TypeError):
+        return ""
+
+
+def _prefix_length(token_counts: Iterable[int], threshold: float) -> int:
+    """
+    Count the leading messages needed to reach a token threshold.
+
+    The running sum and the search both run in C (itertools.accumulate and
+    bisect), so long histories don't pay a Python-level loop per message.
+
+    Args:
+        token_counts: Per-message token estimates, oldest first
+        threshold: Cumulative token count to reach
+
+    Returns:
+        Number of leading messages whose tokens add up to at least threshold
+    """
+    return bisect.bisect_left(list(accumulate(token_counts)), threshold) + 1
+
+
+# Default Jarvis personality. Interned once at import so every Brain shares
+# the same string object (cheap identity checks and hashing of the prefix).
+_DEFAULT_SYSTEM_PROMPT = sys.intern("""You are Jarvis, an advanced AI assistant integrated with a voice interface.
+
+Your Core Capabilities:
+- Natural conversation in concise, clear responses
+- Hardware control through connected devices
+- Application launching and system control
+- Time and date information
+- General knowledge and assistance
+
+Response Guidelines:
+- Keep responses brief and conversational (1-3 sentences for simple queries)
+- Be helpful, friendly, and professional
+- Confirm actions before executing commands
+- If unsure, ask for clarification
+- Use natural speech patterns suitable for voice output
+- Avoid overly technical jargon unless specifically requested
+
+When asked to control hardware:
+- Confirm the specific action clearly
+- Report success or failure concisely
+
+When asked to open applications:
+- Confirm which application is being launched
+- Keep confirmation brief
+
+Your personality:
+- Professional yet approachable
+- Efficient and action-oriented
+- Slightly witty when appropriate
+- Always respectful and helpful
+""")
+
+# Keyword patterns for get_intent(): action verbs anywhere mark a command,
+# a leading question word marks a question
+_COMMAND_RE = re.compile(
+    r"\b(open|close|launch|start|stop|turn (?:on|off)|play|set|activate)\b", re.I)
+_QUESTION_RE = re.compile(
+    r"^\s*(what|why|how|when|where|who|is|are|do(?:es)?|can)\b", re.I)
+
+# Summary message that replaces older history once the budget is exceeded
+_SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+_SUMMARY_MAX_CHARS = 800
+_SUMMARY_LINE_CHARS = 120
+_SENTENCE_END_RE = re.compile(r"[.!?](?:\s|$)")
+
+
+def _first_sentence(text: str) -> str:
+    """
+    Extract the first sentence of a message for the history summary.
+
+    Args:
+        text: Message content
+
+    Returns:
+        First sentence, shortened to at most _SUMMARY_LINE_CHARS characters
+    """
+    text = " ".join(text.split())
+    match = _SENTENCE_END_RE.search(text)
+    sentence = text[:match.start() + 1] if match else text
+    if len(sentence) > _SUMMARY_LINE_CHARS:
+        sentence = sentence[:_SUMMARY_LINE_CHARS - 3].rstrip() + "..."
+    return sentence
+
+
+# Spoken when the model returns nothing
+_EMPTY_REPLY_MESSAGE = "I apologize, but I didn't generate a response. Could you rephrase that?"
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Approximate the token count of a message (~4 characters per token).
+
+    Args:
+        text: Message content
+
+    Returns:
+        Estimated token count including per-message overhead
+    """
+    return len(text) // 4 + _MESSAGE_TOKEN_OVERHEAD
+
 
 # ============================================================================
 # BRAIN CLASS - AI COMMUNICATION CORE
@@ -51,17 +196,73 @@ class Brain:
                           If None, uses default Jarvis personality.
         """
         # Set system prompt (personality and behavior instructions)
-        self.system_prompt = system_prompt or self._get_default_system_prompt()
+        self.system_prompt = system_prompt or _DEFAULT_SYSTEM_PROMPT
+
+        # System message shared by every request; rebuilt only when the
+        # prompt changes so each turn starts with the identical object
+        self._system_msg: Dict[str, str] = {"role": "system", "content": self.system_prompt}
 
-        # Conversation history storage
-        self.history: List[Dict[str, str]] = []
+        # Conversation history storage (deque: trimming pops from the left in O(1))
+        self.history: Deque[Dict[str, str]] = deque()
+
+        # Token accounting, kept parallel to history (one estimate per message).
+        # The system prompt is always sent, so it counts toward the total.
+        self._msg_tokens: Deque[int] = deque()
+        self._system_tokens: int = _estimate_tokens(self.system_prompt)
+        self._total_tokens: int = self._system_tokens
+
+        # Message counts by role, updated on every append and eviction
+        self._user_count: int = 0
+        self._assistant_count: int = 0
 
         # Context tracking for better responses
         self.last_topic: Optional[str] = None
         self.interaction_count: int = 0
 
+        # Extra request arguments for every ollama.chat call. keep_alive keeps
+        # the model resident so the server can reuse the cached prompt prefix.
+        self._request_kwargs: Dict[str, Any] = {"keep_alive": config.OLLAMA_KEEP_ALIVE}
+
+        # Generation options for ordinary turns, built once and shared by
+        # every request that doesn't override the temperature. Treat as
+        # read-only.
+        self._default_options: Dict[str, Any] = {
+            "temperature": config.MODEL_TEMPERATURE,
+            "num_predict": config.MODEL_MAX_TOKENS,
+        }
+
+        # Fingerprint of the context sent last turn (debug-mode prefix check)
+        self._prefix_hash: Optional[int] = None
+
+        # Messages trimmed from the context are archived to disk by a
+        # background thread (started on first eviction) so trimming never
+        # waits on file I/O. None is the shutdown sentinel.
+        self.session_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self._archive_path = os.path.join(config.DATA_DIR, f"history_{self.session_id}.jsonl")
+        self._evicted_log: "queue.Queue[Optional[Dict[str, str]]]" = queue.Queue()
+        self._archive_thread: Optional[threading.Thread] = None
+
         logger.info("Brain initialized with model: %s", config.MODEL_NAME)
 
+        # Load the model now so the first conversation turn doesn't pay for it
+        if config.BRAIN_WARMUP:
+            self._warm_up()
+
+    def _warm_up(self) -> None:
+        """
+        Load the model into Ollama's memory ahead of the first request.
+
+        A generate call with an empty prompt makes Ollama load the model
+        without producing any text; keep_alive keeps it resident afterwards.
+        Failures are not fatal - the model will load on the first chat.
+        """
+        try:
+            ollama.generate(model=config.MODEL_NAME, prompt="",
+                            keep_alive=config.OLLAMA_KEEP_ALIVE)
+            logger.info("Model %s loaded and ready", config.MODEL_NAME)
+        except Exception as exc:
+            logger.warning("Model warm-up failed, it will load on first request: %s", exc)
+
     # ========================================================================
     # SYSTEM PROMPT CONFIGURATION
     # ========================================================================
@@ -73,55 +274,249 @@ class Brain:
         Returns:
             Comprehensive system prompt defining AI behavior
         """
-        return """You are Jarvis, an advanced AI assistant integrated with a voice interface.
+        return _DEFAULT_SYSTEM_PROMPT
 
-Your Core Capabilities:
-- Natural conversation in concise, clear responses
-- Hardware control through connected devices
-- Application launching and system control
-- Time and date information
-- General knowledge and assistance
+    # ========================================================================
+    # HISTORY MANAGEMENT
+    # ========================================================================
+    def _append_message(self, role: str, content: str) -> None:
+        """
+        Append a message to history and update token accounting.
 
-Response Guidelines:
-- Keep responses brief and conversational (1-3 sentences for simple queries)
-- Be helpful, friendly, and professional
-- Confirm actions before executing commands
-- If unsure, ask for clarification
-- Use natural speech patterns suitable for voice output
-- Avoid overly technical jargon unless specifically requested
+        Args:
+            role: Message role ("user" or "assistant")
+            content: Message text
+        """
+        tokens = _estimate_tokens(content)
+        self.history.append({"role": role, "content": content})
+        self._msg_tokens.append(tokens)
+        self._total_tokens += tokens
+        self._count_role(role, 1)
 
-When asked to control hardware:
-- Confirm the specific action clearly
-- Report success or failure concisely
+    def _count_role(self, role: str, delta: int) -> None:
+        """
+        Adjust the per-role message counters.
 
-When asked to open applications:
-- Confirm which application is being launched
-- Keep confirmation brief
+        Args:
+            role: Role of the message added or removed
+            delta: +1 for an added message, -1 for a removed one
+        """
+        if role == "user":
+            self._user_count += delta
+        elif role == "assistant":
+            self._assistant_count += delta
 
-Your personality:
-- Professional yet approachable
-- Efficient and action-oriented
-- Slightly witty when appropriate
-- Always respectful and helpful
-"""
+    def _trim_history(self) -> None:
+        """
+        Keep the estimated context size within the configured token budget.
+
+        Once the system prompt plus history reaches CONTEXT_TOKEN_BUDGET * 0.8,
+        the older half of the conversation (by tokens) is folded into a summary message
+        (if ENABLE_HISTORY_SUMMARY), then the oldest messages are dropped
+        until the context fits. The system prompt and the summary are never
+        trimmed, and the most recent message is always kept.
+        """
+        limit = config.CONTEXT_TOKEN_BUDGET * _CONTEXT_TRIM_RATIO
+        if self._total_tokens < limit:
+            return
+
+        if config.ENABLE_HISTORY_SUMMARY and len(self.history) >= 4:
+            # Fold the older half of the history (by tokens, not message
+            # count) into a summary, keeping at least the last exchange
+            history_tokens = self._total_tokens - self._system_tokens
+            k = _prefix_length(self._msg_tokens, history_tokens / 2)
+            self._summarize_prefix(max(2, min(k, len(self.history) - 2)))
+
+        # A summary at the front stays pinned there; eviction starts after it
+        first = 1 if self._has_summary() else 0
+
+        removed = 0
+        while self._total_tokens >= limit and len(self.history) > first + 1:
+            evicted = self.history[first]
+            del self.history[first]
+            self._total_tokens -= self._msg_tokens[first]
+            del self._msg_tokens[first]
+            self._count_role(evicted["role"], -1)
+            self._archive(evicted)
+            removed += 1
+
+        # The prompt prefix changed, so the next turn can't match it
+        self._prefix_hash = None
+
+        if removed and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Trimmed %d messages from history (%d tokens remain)",
+                         removed, self._total_tokens)
+
+    def _has_summary(self) -> bool:
+        """
+        Check whether history starts with a summary message.
+
+        Returns:
+            True if history[0] is a summary made by _summarize_prefix
+        """
+        if not self.history:
+            return False
+        first = self.history[0]
+        return first["role"] == "system" and first["content"].startswith(_SUMMARY_PREFIX)
+
+    def _summarize_prefix(self, k: int) -> None:
+        """
+        Replace the oldest k messages with a single summary message.
+
+        The summary is extractive (the first sentence of each message), so
+        it costs no extra model call. An earlier summary at the front of
+        history is folded into the new one, keeping the most recent lines
+        when the summary grows past its size limit.
+
+        Args:
+            k: Number of messages to fold into the summary
+        """
+        lines: List[str] = []
+
+        for _ in range(k):
+            msg = self.history.popleft()
+            self._total_tokens -= self._msg_tokens.popleft()
+            self._count_role(msg["role"], -1)
+            self._archive(msg)
+
+            if msg["role"] == "system" and msg["content"].startswith(_SUMMARY_PREFIX):
+                lines.extend(msg["content"][len(_SUMMARY_PREFIX):].splitlines())
+            else:
+                lines.append(f"{msg['role'].upper()}: {_first_sentence(msg['content'])}")
+
+        # Drop the oldest lines until the summary fits
+        while len(lines) > 1 and sum(len(line) + 1 for line in lines) > _SUMMARY_MAX_CHARS:
+            lines.pop(0)
+
+        content = _SUMMARY_PREFIX + "\n".join(lines)
+        tokens = _estimate_tokens(content)
+        self.history.appendleft({"role": "system", "content": content})
+        self._msg_tokens.appendleft(tokens)
+        self._total_tokens += tokens
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Summarized %d messages into %d tokens", k, tokens)
 
     # ========================================================================
-    # HISTORY MANAGEMENT
+    # HISTORY ARCHIVE
     # ========================================================================
-    def _trim_history(self) -> None:
+    def _archive(self, message: Dict[str, str]) -> None:
         """
-        Maintain conversation history within configured limits.
+        Queue an evicted message for the on-disk archive.
+
+        Summary messages are synthetic and are not archived.
 
-        Keeps only the most recent messages to prevent context overflow
-        and maintain response speed. Removes oldest messages first.
+        Args:
+            message: Message removed from the in-context history
+        """
+        if not config.ENABLE_HISTORY_ARCHIVE or message["role"] == "system":
+            return
+
+        # Started on first use, and again if close() has stopped it
+        if self._archive_thread is None or not self._archive_thread.is_alive():
+            self._archive_thread = threading.Thread(
+                target=self._flush_evicted,
+                daemon=True,
+                name="HistoryArchive"
+            )
+            self._archive_thread.start()
+
+        self._evicted_log.put(message)
+
+    def _flush_evicted(self) -> None:
+        """Write queued evicted messages to the archive file in batches."""
+        while True:
+            batch = [self._evicted_log.get()]
+            while len(batch) < _ARCHIVE_BATCH_SIZE:
+                try:
+                    batch.append(self._evicted_log.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [json.dumps(msg, ensure_ascii=False) for msg in batch if msg is not None]
+            try:
+                if lines:
+                    with open(self._archive_path, "a", encoding="utf-8") as archive:
+                        archive.write("\n".join(lines) + "\n")
+            except OSError as exc:
+                logger.error("Could not write history archive: %s", exc)
+            finally:
+                for _ in batch:
+                    self._evicted_log.task_done()
+
+            if None in batch:
+                return
+
+    def search_evicted(self, query: str, limit: int = 5) -> List[Dict[str, str]]:
         """
-        max_length = config.MAX_HISTORY_LENGTH
-        excess = len(self.history) - max_length
+        Search messages that were trimmed from the context.
 
-        if excess > 0:
-            removed = self.history[:excess]
-            self.history = self.history[excess:]
-            logger.debug("Trimmed %d messages from history", excess)
+        Scans this session's archive file for messages containing the query
+        (case-insensitive). Useful for pulling older facts back into a prompt.
+
+        Args:
+            query: Text to look for
+            limit: Maximum number of matches to return
+
+        Returns:
+            Matching messages, most recent last
+        """
+        # Make sure everything evicted so far has been written
+        if self._archive_thread is not None and self._archive_thread.is_alive():
+            self._evicted_log.join()
+
+        needle = query.lower()
+        matches: List[Dict[str, str]] = []
+        try:
+            with open(self._archive_path, encoding="utf-8") as archive:
+                for line in archive:
+                    if needle in line.lower():
+                        matches.append(json.loads(line))
+        except FileNotFoundError:
+            return []
+
+        return matches[-limit:]
+
+    def close(self) -> None:
+        """
+        Flush pending archive writes and stop the archive thread.
+
+        The Brain stays usable; a later eviction starts a new thread.
+        """
+        if self._archive_thread is not None and self._archive_thread.is_alive():
+            self._evicted_log.put(None)
+            self._archive_thread.join(timeout=2.0)
+
+    @staticmethod
+    def _fingerprint(messages: List[Dict[str, str]]) -> int:
+        """
+        Hash a message sequence by role and content, in order.
+
+        Args:
+            messages: Messages to fingerprint
+
+        Returns:
+            Hash identifying the exact message sequence
+        """
+        return hash(tuple((msg["role"], msg["content"]) for msg in messages))
+
+    def _check_prefix_reuse(self, messages: List[Dict[str, str]]) -> None:
+        """
+        Verify this turn extends the previous turn's context unchanged.
+
+        Ollama only reuses its KV cache when the previous conversation is an
+        exact prefix of the new request. Anything that rewrites earlier
+        messages forces a full re-prefill, so log it when it happens.
+
+        Args:
+            messages: Full message list about to be sent
+        """
+        if self._prefix_hash is None:
+            return
+
+        if self._fingerprint(messages[:-1]) != self._prefix_hash:
+            logger.warning("Prompt prefix changed since last turn - "
+                           "model cache cannot be reused")
 
     def clear_history(self) -> None:
         """
@@ -132,6 +527,11 @@ Your personality:
         """
         message_count = len(self.history)
         self.history.clear()
+        self._msg_tokens.clear()
+        self._total_tokens = self._system_tokens
+        self._user_count = 0
+        self._assistant_count = 0
+        self._prefix_hash = None
         self.last_topic = None
         self.interaction_count = 0
         logger.info("Cleared conversation history (%d messages)", message_count)
@@ -146,11 +546,8 @@ Your personality:
         if not self.history:
             return "No conversation history"
 
-        user_msgs = sum(1 for msg in self.history if msg["role"] == "user")
-        assistant_msgs = sum(1 for msg in self.history if msg["role"] == "assistant")
-
         return (f"History: {len(self.history)} messages "
-                f"({user_msgs} user, {assistant_msgs} assistant)")
+                f"({self._user_count} user, {self._assistant_count} assistant)")
 
     # ========================================================================
     # CORE CHAT FUNCTIONALITY
@@ -173,91 +570,258 @@ Your personality:
         Returns:
             The AI's response text, or an error message if something fails
         """
+        if not config.ENABLE_BATCHING:
+            return "".join(self.chat_stream(user_message, temperature)).strip()
+
+        # The broker runs its own event loop, so waiting on the future works
+        # from any thread, including one that is running an event loop
         try:
-            # ================================================================
-            # STEP 1: Add user message to history
-            # ================================================================
-            self.history.append({"role": "user", "content": user_message})
-            self.interaction_count += 1
-            logger.debug("User message added to history (interaction #%d)",
-                         self.interaction_count)
+            messages = self._prepare_turn(user_message)
+            response = self._submit_batched(messages, temperature).result()
+            return self._finish_batched(response)
+        except Exception as exc:
+            return self._error_reply(exc)
 
-            # Trim history if needed
-            self._trim_history()
+    def chat_stream(self, user_message: str,
+                    temperature: Optional[float] = None,
+                    context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Send a message to the AI model and yield the response as it arrives.
 
-            # ================================================================
-            # STEP 2: Build message context
-            # ================================================================
-            messages: List[Dict[str, str]] = [
-                {"role": "system", "content": self.system_prompt}
-            ]
+        Same flow as chat(), but text chunks are yielded as soon as the model
+        produces them so speech can start before generation finishes. The
+        response is added to history once the stream ends, including when it
+        fails or the caller stops reading partway; history then holds only
+        the part that was actually yielded. Streamed requests always go
+        straight to Ollama; ENABLE_BATCHING applies to chat() and achat().
 
-            # Add conversation history for context
-            if config.ENABLE_CONTEXT:
-                messages.extend(self.history)
-            else:
-                # Without context, only use the current message
-                messages.append(self.history[-1])
+        Args:
+            user_message: The user's input text
+            temperature: Override default temperature for this request
+            context: Extra state for this turn only (see chat_with_context)
 
-            logger.debug("Sending %d messages to model", len(messages))
+        Yields:
+            Response text chunks, or a single error message if the request
+            fails before any text is produced. An error later in the stream
+            ends it without appending the error to the reply.
+        """
+        parts: List[str] = []
+        try:
+            messages = self._prepare_turn(user_message, context)
 
             # ================================================================
-            # STEP 3: Call Ollama API
+            # STEP 3: Call Ollama API (streaming)
             # ================================================================
-            response: Dict[str, Any] = ollama.chat(
+            stream = ollama.chat(
                 model=config.MODEL_NAME,
                 messages=messages,
-                options={
-                    "temperature": temperature or config.MODEL_TEMPERATURE,
-                    "num_predict": config.MODEL_MAX_TOKENS,
-                }
+                options=self._options(temperature),
+                stream=True,
+                **self._request_kwargs
             )
 
             # ================================================================
-            # STEP 4: Extract and store response
+            # STEP 4: Relay chunks as they are generated
             # ================================================================
-            assistant_reply = response.get("message", {}).get("content", "").strip()
-
-            if not assistant_reply:
-                logger.warning("Received empty response from model")
-                return "I apologize, but I didn't generate a response. Could you rephrase that?"
-
-            # Add assistant response to history
-            self.history.append({"role": "assistant", "content": assistant_reply})
-            self._trim_history()
-
-            logger.info("Response generated successfully (%d chars)",
-                        len(assistant_reply))
-
-            return assistant_reply
-
-        except Exception as ollama_exc:
-            # Check if it's an Ollama ResponseError (if it exists)
-            if hasattr(ollama, "ResponseError") and isinstance(ollama_exc, ollama.ResponseError):
-                # ================================================================
-                # HANDLE OLLAMA-SPECIFIC ERRORS
-                # ================================================================
-                logger.error("Ollama API error: %s", ollama_exc)
-                return (f"I encountered an issue with the AI model: {ollama_exc}. "
-                        "Please make sure Ollama is running and the model is available.")
-            elif isinstance(ollama_exc, ConnectionError):
-                # ================================================================
-                # HANDLE CONNECTION ERRORS
-                # ================================================================
-                logger.error("Connection error: %s", ollama_exc)
-                return ("I can't connect to the AI model right now. "
-                        "Please make sure Ollama is installed and running on your system. "
-                        "You can download it from https://ollama.com/download")
-            else:
-                # Re-raise to be caught by outer exception handler
-                raise
+            for chunk in stream:
+                piece = _message_content(chunk)
+                if piece:
+                    parts.append(piece)
+                    yield piece
+
+        except Exception as exc:
+            error_message = self._error_reply(exc)
+            if not parts:
+                yield error_message
+                return
+            logger.warning("Response stream ended early after %d chunks", len(parts))
+
+        finally:
+            # ================================================================
+            # STEP 5: Store the response (complete or partial)
+            # ================================================================
+            assistant_reply = "".join(parts).strip()
+            if assistant_reply:
+                self._record_reply(assistant_reply)
+
+        if not assistant_reply:
+            logger.warning("Received empty response from model")
+            yield _EMPTY_REPLY_MESSAGE
+
+    async def achat(self, user_message: str, temperature: Optional[float] = None) -> str:
+        """
+        Async version of chat() that routes through the batching broker.
+
+        Requests submitted from any thread or event loop within the broker's
+        collection window are sent to Ollama together (see brain_server).
+        Turns on the same Brain should still be awaited one at a time so
+        history stays in order.
+
+        Args:
+            user_message: The user's input text
+            temperature: Override default temperature for this request
 
+        Returns:
+            The AI's response text, or an error message if something fails
+        """
+        try:
+            messages = self._prepare_turn(user_message)
+            response = await asyncio.wrap_future(
+                self._submit_batched(messages, temperature))
+            return self._finish_batched(response)
         except Exception as exc:
+            return self._error_reply(exc)
+
+    def _submit_batched(self, messages: List[Dict[str, str]],
+                        temperature: Optional[float]) -> Future:
+        """
+        Queue a request on the batching broker.
+
+        Args:
+            messages: Context built by _prepare_turn
+            temperature: Temperature override, or None for the default
+
+        Returns:
+            Future resolved with the Ollama response
+        """
+        return get_broker().submit(
+            model=config.MODEL_NAME,
+            messages=messages,
+            options=self._options(temperature),
+            **self._request_kwargs
+        )
+
+    def _finish_batched(self, response: Any) -> str:
+        """
+        Record the reply from a batched request.
+
+        Args:
+            response: Ollama chat response
+
+        Returns:
+            The AI's response text, or a fallback if it was empty
+        """
+        assistant_reply = _message_content(response).strip()
+
+        if not assistant_reply:
+            logger.warning("Received empty response from model")
+            return _EMPTY_REPLY_MESSAGE
+
+        self._record_reply(assistant_reply)
+        return assistant_reply
+
+    def _options(self, temperature: Optional[float]) -> Dict[str, Any]:
+        """
+        Get generation options for a request.
+
+        Args:
+            temperature: Temperature override, or None for the default
+
+        Returns:
+            The shared default options, or a copy with the temperature replaced
+        """
+        if temperature is None:
+            return self._default_options
+        return {**self._default_options, "temperature": temperature}
+
+    def _prepare_turn(self, user_message: str,
+                      context: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """
+        Record the user's message and build the context for this turn.
+
+        Args:
+            user_message: The user's input text
+            context: Extra state for this turn only, sent as a system message
+                     just before the user's message and never stored
+
+        Returns:
+            Messages to send to the model (system prompt first)
+        """
+        # ================================================================
+        # STEP 1: Add user message to history
+        # ================================================================
+        self._append_message("user", user_message)
+        self.interaction_count += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("User message added to history (interaction #%d)",
+                         self.interaction_count)
+
+        # Trim history to the token budget before building the context
+        self._trim_history()
+
+        # ================================================================
+        # STEP 2: Build message context
+        # ================================================================
+        if config.ENABLE_CONTEXT:
+            # System prompt followed by the conversation history
+            messages = [self._system_msg, *self.history]
+        else:
+            # Without context, only use the current message
+            messages = [self._system_msg, self.history[-1]]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending %d messages to model", len(messages))
+            if config.ENABLE_CONTEXT:
+                self._check_prefix_reuse(messages)
+
+        if context:
+            # Volatile state goes after the stable prefix (system prompt +
+            # history) so it never invalidates the model's cached context
+            context_str = "\n".join(f"{k}: {v}" for k, v in context.items())
+            messages.insert(-1, {"role": "system", "content": f"Current state:\n{context_str}"})
+
+        return messages
+
+    def _record_reply(self, assistant_reply: str) -> None:
+        """
+        Add a completed assistant reply to history.
+
+        Args:
+            assistant_reply: Full response text from the model
+        """
+        self._append_message("assistant", assistant_reply)
+        self._trim_history()
+
+        if config.ENABLE_CONTEXT and logger.isEnabledFor(logging.DEBUG):
+            self._prefix_hash = self._fingerprint([self._system_msg, *self.history])
+
+        logger.info("Response generated successfully (%d chars)",
+                    len(assistant_reply))
+
+    @staticmethod
+    def _error_reply(exc: Exception) -> str:
+        """
+        Log a failed model request and build a spoken explanation.
+
+        Args:
+            exc: Exception raised while talking to Ollama
+
+        Returns:
+            User-facing error message
+        """
+        # Check if it's an Ollama ResponseError (if it exists)
+        if hasattr(ollama, "ResponseError") and isinstance(exc, ollama.ResponseError):
             # ================================================================
-            # HANDLE UNEXPECTED ERRORS
+            # HANDLE OLLAMA-SPECIFIC ERRORS
             # ================================================================
-            logger.exception("Unexpected error in chat")
-            return f"I encountered an unexpected error: {exc}"
+            logger.error("Ollama API error: %s", exc)
+            return (f"I encountered an issue with the AI model: {exc}. "
+                    "Please make sure Ollama is running and the model is available.")
+
+        if isinstance(exc, ConnectionError):
+            # ================================================================
+            # HANDLE CONNECTION ERRORS
+            # ================================================================
+            logger.error("Connection error: %s", exc)
+            return ("I can't connect to the AI model right now. "
+                    "Please make sure Ollama is installed and running on your system. "
+                    "You can download it from https://ollama.com/download")
+
+        # ====================================================================
+        # HANDLE UNEXPECTED ERRORS
+        # ====================================================================
+        logger.exception("Unexpected error in chat")
+        return f"I encountered an unexpected error: {exc}"
 
     # ========================================================================
     # ADVANCED FEATURES
@@ -268,6 +832,8 @@ Your personality:
 
         Useful for providing the AI with current system state, recent actions,
         or other relevant information that helps generate better responses.
+        The context is sent as a separate system message for this turn only;
+        history records just the user's message.
 
         Args:
             user_message: The user's input text
@@ -276,26 +842,38 @@ Your personality:
         Returns:
             The AI's contextually-aware response
         """
-        # Build enhanced message with context
-        context_str = "\n".join(f"{k}: {v}" for k, v in context.items())
-        enhanced_message = f"{user_message}\n\nCurrent Context:\n{context_str}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Chat with context: %s", list(context))
+        return "".join(self.chat_stream(user_message, context=context)).strip()
 
-        logger.debug("Chat with context: %s", context.keys())
-        return self.chat(enhanced_message)
-
-    def get_intent(self, user_message: str) -> str:
+    def get_intent(self, user_message: str, use_llm: bool = False) -> str:
         """
         Analyze user message to determine intent/category.
 
         This can be used for better routing to skills or understanding
-        what the user wants to accomplish.
+        what the user wants to accomplish. By default the message is
+        classified with keyword patterns, which avoids a second model
+        round-trip per turn.
 
         Args:
             user_message: The user's input text
+            use_llm: Ask the model to classify instead of using patterns
 
         Returns:
-            Detected intent category (e.g., "question", "command", "conversation")
+            Detected intent category ("QUESTION", "COMMAND", "CONVERSATION",
+            or "UNKNOWN" if the model gives an unusable answer)
         """
+        if not use_llm:
+            if _COMMAND_RE.search(user_message):
+                intent = "COMMAND"
+            elif _QUESTION_RE.match(user_message) or user_message.rstrip().endswith("?"):
+                intent = "QUESTION"
+            else:
+                intent = "CONVERSATION"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Detected intent: %s", intent)
+            return intent
+
         intent_prompt = (
             f"Analyze this message and respond with only ONE word: "
             f"'QUESTION' if asking for information, "
@@ -307,7 +885,8 @@ Your personality:
         try:
             response = self.chat(intent_prompt, temperature=0.1)
             intent = response.strip().upper()
-            logger.debug("Detected intent: %s", intent)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Detected intent: %s", intent)
             return intent if intent in ["QUESTION", "COMMAND", "CONVERSATION"] else "UNKNOWN"
         except Exception as exc:
             logger.error("Intent detection failed: %s", exc)
@@ -320,10 +899,17 @@ Your personality:
         """
         Update the system prompt (AI personality/behavior).
 
+        Also clears the conversation history: the system prompt heads every
+        request, so changing it invalidates the model's cached context and
+        the old history was produced under different instructions.
+
         Args:
             new_prompt: New system prompt text
         """
         self.system_prompt = new_prompt
+        self._system_msg = {"role": "system", "content": new_prompt}
+        self._system_tokens = _estimate_tokens(new_prompt)
+        self.clear_history()
         logger.info("System prompt updated")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -336,7 +922,8 @@ Your personality:
         return {
             "model": config.MODEL_NAME,
             "history_length": len(self.history),
-            "max_history": config.MAX_HISTORY_LENGTH,
+            "context_tokens": self._total_tokens,
+            "token_budget": config.CONTEXT_TOKEN_BUDGET,
             "interactions": self.interaction_count,
             "context_enabled": config.ENABLE_CONTEXT,
             "last_topic": self.last_topic
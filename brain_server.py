@@ -0,0 +1,170 @@
+"""
+Brain Server Module - Batched Requests to Ollama
+================================================
+Collects chat requests that arrive close together and dispatches them to
+Ollama concurrently, so the server can decode them as one batch instead of
+serving them strictly one after another.
+
+Key Features:
+- Shared asyncio event loop on a background thread
+- Short collection window before each dispatch
+- Thread-safe submission from synchronous or async code
+"""
+
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import threading
+import ollama
+import config
+
+# ============================================================================
+# LOGGING SETUP
+# ============================================================================
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for more requests before dispatching a batch
+BATCH_WINDOW: float = 0.02
+
+
+# ============================================================================
+# BATCHING BROKER
+# ============================================================================
+class BatchingBroker:
+    """
+    Request broker that batches concurrent chat calls to Ollama.
+
+    This class handles:
+    - Queueing chat requests from any thread
+    - Flushing the queue after a short collection window
+    - Sending each batch concurrently so Ollama can serve it together
+    - Delivering each response (or error) back to its caller
+    """
+
+    def __init__(self, window: float = BATCH_WINDOW) -> None:
+        """
+        Start the broker's event loop thread.
+
+        Args:
+            window: Seconds to collect requests before dispatching them
+        """
+        self.window = window
+
+        # Requests waiting for the next flush, with the future to resolve
+        self._pending: Deque[Tuple[Future, Dict[str, Any]]] = deque()
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+
+        # The async client is created on the loop thread on first dispatch
+        self._client: Optional[ollama.AsyncClient] = None
+
+        # Statistics
+        self.batches_sent = 0
+        self.requests_sent = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            daemon=True,
+            name="BatchingBroker"
+        )
+        self._thread.start()
+        logger.info("Batching broker started (window: %.0f ms)", window * 1000)
+
+    def submit(self, **request: Any) -> Future:
+        """
+        Queue a chat request for the next batch.
+
+        Safe to call from any thread. Async callers can await the result
+        with asyncio.wrap_future().
+
+        Args:
+            **request: Keyword arguments for ollama.AsyncClient.chat
+
+        Returns:
+            Future resolving to the chat response
+        """
+        future: Future = Future()
+
+        with self._lock:
+            self._pending.append((future, request))
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self._loop.call_soon_threadsafe(
+                    self._loop.call_later, self.window, self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        """Take everything queued so far and dispatch it as one batch."""
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+        if batch:
+            self._loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[Tuple[Future, Dict[str, Any]]]) -> None:
+        """
+        Send a batch of requests to Ollama concurrently.
+
+        Args:
+            batch: Pending (future, request) pairs
+        """
+        if self._client is None:
+            self._client = ollama.AsyncClient(host=config.OLLAMA_HOST)
+
+        self.batches_sent += 1
+        self.requests_sent += len(batch)
+        logger.debug("Dispatching batch of %d request(s)", len(batch))
+
+        results = await asyncio.gather(
+            *(self._client.chat(**request) for _, request in batch),
+            return_exceptions=True
+        )
+
+        for (future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with batch and request counts
+        """
+        return {
+            "batches_sent": self.batches_sent,
+            "requests_sent": self.requests_sent,
+            "avg_batch_size": (f"{self.requests_sent / self.batches_sent:.2f}"
+                               if self.batches_sent else "0.00"),
+        }
+
+
+# ============================================================================
+# SHARED BROKER
+# ============================================================================
+_broker: Optional[BatchingBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> BatchingBroker:
+    """
+    Get the process-wide batching broker, starting it on first use.
+
+    Returns:
+        Shared BatchingBroker instance
+    """
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = BatchingBroker()
+        return _broker
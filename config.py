@@ -20,6 +20,12 @@ from typing import Dict, List
 from pathlib import Path
 ## from dotenv import load_dotenv
 
+# Optional: orjson parses JSON in C; fall back to the standard library
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
 # ============================================================================
 # ENVIRONMENT SETUP
 # ============================================================================
@@ -33,6 +39,10 @@ from pathlib import Path
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Echo each heard phrase and reply to the console (set VERBOSE=false to
+# keep the console quiet and rely on the log instead)
+VERBOSE: bool = os.getenv("VERBOSE", "true").lower() == "true"
+
 # ============================================================================
 # WAKE WORDS & ACTIVATION
 # ============================================================================
@@ -54,6 +64,13 @@ MODEL_NAME: str = OLLAMA_MODEL  # Backward compatibility alias
 # Ollama API endpoint (default: local installation)
 OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
+# How long Ollama keeps the model (and its KV cache) resident between requests.
+# Keeping it loaded lets multi-turn chats reuse the already-processed prefix.
+OLLAMA_KEEP_ALIVE: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+# Load the model when Brain starts instead of on the first chat request
+BRAIN_WARMUP: bool = os.getenv("BRAIN_WARMUP", "true").lower() == "true"
+
 # Model parameters for response generation
 MODEL_TEMPERATURE: float = float(os.getenv("MODEL_TEMPERATURE", "0.7"))
 MODEL_MAX_TOKENS: int = int(os.getenv("MODEL_MAX_TOKENS", "500"))
@@ -76,73 +93,22 @@ HARDWARE_TIMEOUT: int = int(os.getenv("HARDWARE_TIMEOUT", "3"))
 APP_PATHS_JSON: str = os.getenv("APP_PATHS_JSON", "{}")
 
 
-# Helper function for debug logging
-def _debug_log(location: str, message: str, data: dict, hypothesis_id: str = "A"):
-    """Write debug log entry safely."""
-    try:
-        Path(".cursor").mkdir(exist_ok=True)
-        with open(".cursor/debug.log", "a") as f:
-            import json as json_module
-            import time
-            f.write(json_module.dumps({
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data,
-                "timestamp": time.time() * 1000
-            }) + "\n")
-    except:
-        pass
-
-
 # Parse application paths with error handling
 def _load_app_paths() -> Dict[str, str]:
     """
-    Parse and validate application paths from JSON configuration.
+    Parse application paths from JSON configuration.
 
     Returns:
         Dictionary mapping application names to their file paths
     """
-    # #region agent log
-    _debug_log("config.py:_load_app_paths:87", "Function entry", {"app_paths_json": APP_PATHS_JSON[:100] if APP_PATHS_JSON else "empty"})
-    # #endregion
     try:
         if not APP_PATHS_JSON:
             return {}
-        paths = json.loads(APP_PATHS_JSON)
-        # #region agent log
-        _debug_log("config.py:_load_app_paths:90", "JSON parsed successfully", {"path_count": len(paths)})
-        # #endregion
-        # Validate that all paths exist and log warnings for missing ones
-        validated_paths = {}
-        for app_name, path in paths.items():
-            if os.path.exists(path):
-                validated_paths[app_name] = path
-            else:
-                # #region agent log
-                _debug_log("config.py:_load_app_paths:97", "Before logging.warning call", {"app_name": app_name, "path": path})
-                # #endregion
-                try:
-                    logging.warning(f"Configured path for '{app_name}' not found: {path}")
-                except Exception as log_exc:
-                    # #region agent log
-                    _debug_log("config.py:_load_app_paths:97", "logging.warning failed", {"error": str(log_exc)})
-                    # #endregion
-                    pass
-        return validated_paths
-    except json.JSONDecodeError as e:
-        # #region agent log
-        _debug_log("config.py:_load_app_paths:100", "Before logging.error call", {"error": str(e)})
-        # #endregion
-        try:
-            logging.error(f"Invalid JSON in APP_PATHS_JSON: {e}")
-        except Exception as log_exc:
-            # #region agent log
-            _debug_log("config.py:_load_app_paths:100", "logging.error failed", {"error": str(log_exc)})
-            # #endregion
-            pass
+        # Paths are checked against the filesystem by skills, which also
+        # tells the user when a configured app is missing
+        return dict(_json.loads(APP_PATHS_JSON))
+    except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
+        logging.error(f"Invalid JSON in APP_PATHS_JSON: {e}")
         return {}
 
 
@@ -155,16 +121,64 @@ APP_PATHS: Dict[str, str] = _load_app_paths()
 DEFAULT_VOICE_RATE: int = int(os.getenv("VOICE_RATE", "175"))  # Words per minute
 DEFAULT_VOICE_VOLUME: float = float(os.getenv("VOICE_VOLUME", "0.9"))  # 0.0 to 1.0
 
+# Cache synthesized speech as WAV files so repeated phrases skip synthesis
+# (needs simpleaudio for playback: pip install simpleaudio)
+ENABLE_TTS_CACHE: bool = os.getenv("ENABLE_TTS_CACHE", "true").lower() == "true"
+TTS_CACHE_DIR: str = os.getenv("TTS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "jarvis_tts"))
+TTS_CACHE_MAX_BYTES: int = int(os.getenv("TTS_CACHE_MAX_MB", "10")) * 1024 * 1024
+
+# Pin the speech worker thread to this CPU (Linux only; -1 leaves placement
+# to the scheduler). On small boards this keeps speech from competing with
+# recognition for every core, at the cost of speech never using the others.
+SPEECH_CPU: int = int(os.getenv("SPEECH_CPU", "-1"))
+
+# Stock replies synthesized into the speech cache at startup, so the first
+# time each is spoken it plays immediately
+PRECACHE_PHRASES: List[str] = [
+    "Jarvis is online and ready.",
+    "Conversation history cleared.",
+    "Hardware control is currently disabled.",
+    "Web search is currently disabled.",
+]
+
 # Speech recognition parameters
 SPEECH_ENERGY_THRESHOLD: int = int(os.getenv("ENERGY_THRESHOLD", "300"))
 SPEECH_PAUSE_THRESHOLD: float = float(os.getenv("PAUSE_THRESHOLD", "0.6"))
 SPEECH_PHRASE_TIME_LIMIT: int = int(os.getenv("PHRASE_TIME_LIMIT", "8"))
 
+# Offline speech recognition with faster-whisper (pip install faster-whisper)
+# Falls back to Google recognition if the model cannot be loaded
+USE_OFFLINE_RECOGNITION: bool = os.getenv("USE_OFFLINE_RECOGNITION", "false").lower() == "true"
+WHISPER_SIZE: str = os.getenv("WHISPER_SIZE", "base")  # tiny, base, small, medium...
+
+# "auto" lets CTranslate2 pick the device and the fastest precision it
+# supports there (int8 on most CPUs, float16 on most GPUs)
+WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "auto")
+WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
+
+# Pre-quantized model written by scripts/prequantize_whisper.py. Used instead
+# of WHISPER_SIZE when the directory exists, which skips quantizing at startup.
+WHISPER_MODEL_DIR: str = os.getenv("WHISPER_MODEL_DIR", os.path.join("models", f"whisper-{WHISPER_SIZE}-int8"))
+
+# Decoding settings for short voice commands: greedy decoding (beam size 1)
+# and voice activity detection so silence never reaches the decoder
+WHISPER_BEAM_SIZE: int = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+WHISPER_VAD: bool = os.getenv("WHISPER_VAD", "true").lower() == "true"
+
 # ============================================================================
 # CONVERSATION SETTINGS
 # ============================================================================
-# Maximum number of messages to keep in conversation history
-MAX_HISTORY_LENGTH: int = int(os.getenv("MAX_HISTORY_LENGTH", "10"))
+# Approximate token budget for the context sent to the model (system prompt
+# plus conversation history). History is trimmed to stay below 80% of this.
+CONTEXT_TOKEN_BUDGET: int = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3200"))
+
+# Fold older messages into a short summary when the budget is exceeded,
+# instead of dropping them outright
+ENABLE_HISTORY_SUMMARY: bool = os.getenv("ENABLE_HISTORY_SUMMARY", "true").lower() == "true"
+
+# Append messages trimmed from the context to DATA_DIR/history_<session>.jsonl
+# so they remain searchable (Brain.search_evicted)
+ENABLE_HISTORY_ARCHIVE: bool = os.getenv("ENABLE_HISTORY_ARCHIVE", "true").lower() == "true"
 
 # Enable context-aware responses (remembers previous conversation)
 ENABLE_CONTEXT: bool = os.getenv("ENABLE_CONTEXT", "true").lower() == "true"
@@ -183,12 +197,6 @@ except Exception:
 # Log file location
 LOG_FILE: str = os.path.join(DATA_DIR, "jarvis.log")
 
-# Ensure .cursor directory exists for debug logs
-try:
-    Path(".cursor").mkdir(exist_ok=True)
-except Exception:
-    pass
-
 # ============================================================================
 # FEATURE FLAGS
 # ============================================================================
@@ -197,6 +205,12 @@ ENABLE_HARDWARE_CONTROL: bool = os.getenv("ENABLE_HARDWARE", "true").lower() ==
 ENABLE_APP_LAUNCH: bool = os.getenv("ENABLE_APP_LAUNCH", "true").lower() == "true"
 ENABLE_WEB_SEARCH: bool = os.getenv("ENABLE_WEB_SEARCH", "false").lower() == "true"
 
+# Route Brain.chat/achat through the batching broker (brain_server.py) so
+# requests arriving within a few milliseconds of each other reach Ollama
+# together. Streamed replies (Brain.chat_stream, used by main.py) are not
+# batched, so this only affects direct chat()/achat() callers.
+ENABLE_BATCHING: bool = os.getenv("ENABLE_BATCHING", "false").lower() == "true"
+
 
 # ============================================================================
 # CONFIGURATION VALIDATION
@@ -246,7 +260,7 @@ def get_config_summary() -> Dict:
         "wake_words": WAKE_WORDS,
         "hardware_enabled": ENABLE_HARDWARE_CONTROL,
         "app_launch_enabled": ENABLE_APP_LAUNCH,
-        "max_history": MAX_HISTORY_LENGTH,
+        "context_token_budget": CONTEXT_TOKEN_BUDGET,
         "voice_rate": DEFAULT_VOICE_RATE,
         "log_level": LOG_LEVEL
     }
\ No newline at end of file
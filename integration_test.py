@@ -145,7 +145,7 @@ try:
     key_skills = ['time', 'date', 'open', 'close', 'hardware']
     for skill in key_skills:
         if skill in skills.SKILLS:
-            print(f"  - {skill}: {skills.SKILLS[skill].__name__}")
+            print(f"  - {skill}: {skills.skill_name(skills.SKILLS[skill])}")
     
 except Exception as e:
     print(f"✗ Skills test failed: {e}")
@@ -154,7 +154,8 @@ except Exception as e:
 # Test inter-component communication
 print("\n[TEST] Inter-component communication...")
 try:
-    # Test brain -> speaker communication
+    # Test brain -> speaker communication (main.py streams the reply
+    # sentence by sentence; see JarvisAssistant.process_command)
     brain_response = brain.chat("What time is it?")
     speaker.say(brain_response[:50], block=False)
     print("✓ Brain -> Speaker communication working")
@@ -3,15 +3,18 @@
 Main Loop for Jarvis Voice Assistant
 """
 
+import string
 import sys
 import time
 import logging
-from datetime import datetime
+from datetime import timedelta
 import config
-from brain import Brain
-from listen import Listener
-from speak import Speaker
 import skills
+from _matcher import PhraseMatcher
+
+# brain, listen and speak pull in the Ollama client, speech recognition and
+# the TTS engine; they are imported in JarvisAssistant.__init__ so importing
+# this module (and setting up logging) stays fast
 
 # Setup logging
 logging.basicConfig(
@@ -25,6 +28,44 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Wake words are scanned for in every transcription; compiled once
+_WAKE_MATCHER = PhraseMatcher.build(config.WAKE_WORDS)
+
+# A streamed AI reply is handed to the speaker at each of these
+_SENTENCE_ENDINGS = (".", "!", "?")
+
+# Maps punctuation to spaces so "stop." splits into the token "stop"
+_PUNCTUATION_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _write_console(text):
+    """Write text to the console in one call and flush it."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _parse_arg_text(command, keyword):
+    """Argument parser: all text after the keyword, or None if there is none."""
+    arg_text = " ".join(command.replace(keyword, "", 1).split())
+    return (arg_text,) if arg_text else None
+
+
+def _parse_action(command, keyword):
+    """Argument parser: first word after the keyword, defaulting to "status"."""
+    args = command.replace(keyword, "", 1).split()
+    return (args[0] if args else "status",)
+
+
+# Skills that take arguments from the command, mapped to the parser that
+# extracts them. Skills not listed here are called without arguments.
+SKILL_DISPATCH = {
+    skills.open_app: _parse_arg_text,
+    skills.close_app: _parse_arg_text,
+    skills.search_web: _parse_arg_text,
+    skills.control_hardware: _parse_action,
+}
+
+
 class JarvisAssistant:
     """Main Jarvis assistant orchestrator."""
 
@@ -37,6 +78,10 @@ class JarvisAssistant:
             raise RuntimeError("Invalid configuration - check logs")
 
         logger.info("Initializing components...")
+        from brain import Brain
+        from listen import Listener
+        from speak import Speaker
+
         self.brain = Brain()
         logger.info("[OK] Brain (AI) initialized")
 
@@ -52,6 +97,12 @@ class JarvisAssistant:
         )
         logger.info("[OK] Speaker (Text-to-Speech) initialized")
 
+        # Stop words are matched as whole tokens with one set operation;
+        # phrases like "shut up" are checked against the joined tokens
+        stop_words = [word.lower() for word in config.STOP_WORDS if word]
+        self._stop_words_set = frozenset(w for w in stop_words if " " not in w)
+        self._stop_phrases = tuple(" ".join(w.split()) for w in stop_words if " " in w)
+
         self.running = False
         self.start_time = None
         self.total_interactions = 0
@@ -62,66 +113,57 @@ class JarvisAssistant:
         logger.info("JARVIS INITIALIZATION COMPLETE")
 
     @staticmethod
-    def is_wake_word(text):
-        """Check if text contains any configured wake word."""
+    def is_wake_word(text, lowered=None):
+        """Check if text contains any configured wake word.
+
+        Pass lowered (text.lower()) when the caller already has it.
+        """
         if not text:
             return False
-        lowered = text.lower()
-        for wake_word in config.WAKE_WORDS:
-            if wake_word in lowered:
-                logger.debug("Wake word detected: %s", wake_word)
-                return True
+        match = _WAKE_MATCHER.match_longest(lowered if lowered is not None else text.lower())
+        if match:
+            logger.debug("Wake word detected: %s", match)
+            return True
         return False
 
     @staticmethod
-    def strip_wake_words(text):
-        """Remove wake words from text to extract the actual command."""
-        command = text.lower()
-        for wake_word in config.WAKE_WORDS:
-            command = command.replace(wake_word, "")
-        return command.strip()
-
-    def find_skill(self, text):
-        """Find the best matching skill for the given text."""
-        lowered = text.lower()
-        best_match = None
-        best_keyword = None
-        best_length = 0
-
-        for keyword, func in skills.SKILLS.items():
-            if keyword in lowered and len(keyword) > best_length:
-                best_match = func
-                best_keyword = keyword
-                best_length = len(keyword)
-
-        if best_match:
-            logger.debug("Matched skill: %s -> %s", best_keyword, best_match.__name__)
+    def strip_wake_words(text, lowered=None):
+        """Remove wake words from text to extract the actual command.
+
+        Pass lowered (text.lower()) when the caller already has it.
+        """
+        if lowered is None:
+            lowered = text.lower()
+        return _WAKE_MATCHER.remove(lowered).strip()
+
+    def find_skill(self, lowered):
+        """Find the best matching skill for the given lowercase text."""
+        match = skills.match_skill(lowered)
+        if match is None:
+            return None, None
+
+        best_keyword, best_match = match
+        logger.debug("Matched skill: %s -> %s", best_keyword, skills.skill_name(best_match))
 
         return best_match, best_keyword
 
     def execute_skill(self, skill_func, command, keyword):
         """Execute a skill function with appropriate arguments."""
-        logger.info("Executing skill: %s", skill_func.__name__)
+        logger.info("Executing skill: %s", skills.skill_name(skill_func))
 
         try:
-            if skill_func in [skills.open_app, skills.close_app, skills.search_web]:
-                args = command.replace(keyword, "", 1).strip().split()
-                if args:
-                    arg_text = " ".join(args)
-                    result = skill_func(arg_text)
+            parser = SKILL_DISPATCH.get(skill_func)
+            if parser is None:
+                result = skill_func()
+            else:
+                args = parser(command, keyword)
+                if args is not None:
+                    result = skill_func(*args)
                 else:
                     result = "Please specify what to open."
 
-            elif skill_func is skills.control_hardware:
-                args = command.replace(keyword, "", 1).strip().split()
-                action = args[0] if args else "status"
-                result = skill_func(action)
-
-            else:
-                result = skill_func()
-
             self.successful_commands += 1
-            logger.info("Skill executed successfully: %s", skill_func.__name__)
+            logger.info("Skill executed successfully: %s", skills.skill_name(skill_func))
             return result
 
         except Exception as exc:
@@ -129,26 +171,73 @@ class JarvisAssistant:
             self.errors += 1
             return f"I encountered an unexpected error: {exc}"
 
-    def process_with_ai(self, command):
-        """Process command using AI when no skill matches."""
-        logger.info("Processing with AI: %s", command[:50])
+    def process_command(self, command):
+        """Answer a command (wake words removed) and speak the reply.
+
+        Skills answer at once. AI replies are streamed: each sentence is
+        queued for speech as soon as the model finishes it, so Jarvis starts
+        talking while the rest is still being generated.
 
+        Returns the full reply text.
+        """
+        verbose = config.VERBOSE
+        skill_func, matched_keyword = self.find_skill(command)
+
+        if skill_func:
+            result = self.execute_skill(skill_func, command, matched_keyword)
+            # %.100s truncates during formatting, which logging skips
+            # entirely when INFO is disabled
+            logger.info("Response: %.100s", result)
+            if verbose:
+                _write_console(f"[SKILL] Executing skill: {skills.skill_name(skill_func)}\n"
+                               f"[JARVIS] Jarvis: {result}\n")
+            self.speaker.say(result)
+            return result
+
+        # The AI status is shown right away because the model takes a while
+        logger.info("Processing with AI: %.50s", command)
+        if verbose:
+            _write_console("[AI] Processing with AI...\n")
+
+        say = self.speaker.say
+        parts = []
+        sentence = ""
         try:
-            response = self.brain.chat(command)
+            for chunk in self.brain.chat_stream(command):
+                parts.append(chunk)
+                sentence += chunk
+                if sentence.rstrip().endswith(_SENTENCE_ENDINGS):
+                    say(sentence.strip(), block=False)
+                    sentence = ""
             self.ai_responses += 1
-            logger.info("AI response generated successfully")
-            return response
-
         except Exception as exc:
             logger.exception("AI processing error")
             self.errors += 1
-            return f"I had trouble processing that: {exc}"
+            sentence += f" I had trouble processing that: {exc}"
+
+        if sentence.strip():
+            say(sentence.strip(), block=False)
 
-    def handle_special_commands(self, text):
-        """Handle special system commands."""
-        lowered = text.lower()
+        result = "".join(parts).strip()
+        logger.info("Response: %.100s", result)
+        if verbose:
+            _write_console(f"[JARVIS] Jarvis: {result}\n")
+        return result
 
-        if any(word in lowered for word in config.STOP_WORDS):
+    def _is_stop_command(self, lowered):
+        """Check lowercase text for a stop word or stop phrase."""
+        tokens = lowered.translate(_PUNCTUATION_TABLE).split()
+        if not self._stop_words_set.isdisjoint(tokens):
+            return True
+        if self._stop_phrases:
+            # Pad with spaces so phrases only match on word boundaries
+            padded = f" {' '.join(tokens)} "
+            return any(f" {phrase} " in padded for phrase in self._stop_phrases)
+        return False
+
+    def handle_special_commands(self, lowered):
+        """Handle special system commands in lowercase text."""
+        if self._is_stop_command(lowered):
             self.speaker.stop()
             logger.info("Stop command received")
             print("[STOPPED] Stopped speaking")
@@ -177,7 +266,7 @@ class JarvisAssistant:
     def run(self):
         """Main event loop for Jarvis assistant."""
         self.running = True
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
 
         print("\n" + "=" * 60)
         print("[JARVIS] JARVIS IS NOW LISTENING")
@@ -189,52 +278,59 @@ class JarvisAssistant:
         print("=" * 60 + "\n")
 
         self.speaker.say("Jarvis is online and ready.")
+
+        # Record on a background thread so the next phrase is captured while
+        # this one is transcribed and answered; audio heard while Jarvis is
+        # speaking (or has speech queued) is dropped
+        self.listener.start_background(is_muted=self.speaker.is_busy,
+                                       busy_generation=self.speaker.busy_generation)
         logger.info("Main loop started")
 
+        # Bound once; these run on every pass through the loop
+        wait_until_done = self.speaker.wait_until_done
+        get_audio = self.listener.get_audio
+        transcribe = self.listener.transcribe
+        verbose = config.VERBOSE
+
         while self.running:
             try:
-                if self.speaker.is_speaking():
-                    time.sleep(0.1)
+                # Don't take new commands until Jarvis has finished talking
+                wait_until_done()
+
+                audio = get_audio(timeout=0.5)
+                if audio is None:
                     continue
 
-                heard = self.listener.listen()
+                heard = transcribe(audio)
 
                 if not heard:
                     continue
 
                 logger.info("Heard: %s", heard)
-                print(f"\n[HEARD] Heard: {heard}")
+                if verbose:
+                    _write_console(f"\n[HEARD] Heard: {heard}\n")
 
-                if self.handle_special_commands(heard):
+                # Lowercase once; every check below works on this copy
+                lowered = heard.lower()
+
+                if self.handle_special_commands(lowered):
                     continue
 
-                if not self.is_wake_word(heard):
+                if not self.is_wake_word(heard, lowered):
                     logger.debug("No wake word detected, ignoring")
                     continue
 
                 self.total_interactions += 1
                 logger.info("Wake word detected - interaction #%d", self.total_interactions)
 
-                command = self.strip_wake_words(heard)
+                command = self.strip_wake_words(heard, lowered)
 
                 if not command:
                     logger.debug("Empty command after wake word removal")
                     continue
 
                 logger.info("Processing command: %s", command)
-
-                skill_func, matched_keyword = self.find_skill(command)
-
-                if skill_func:
-                    print(f"[SKILL] Executing skill: {skill_func.__name__}")
-                    result = self.execute_skill(skill_func, command, matched_keyword)
-                else:
-                    print("[AI] Processing with AI...")
-                    result = self.process_with_ai(command)
-
-                logger.info("Response: %s", result[:100])
-                print(f"[JARVIS] Jarvis: {result}")
-                self.speaker.say(result)
+                self.process_command(command)
 
                 time.sleep(0.2)
 
@@ -251,7 +347,9 @@ class JarvisAssistant:
 
     def print_statistics(self):
         """Print current session statistics."""
-        uptime = datetime.now() - self.start_time if self.start_time else None
+        # Monotonic clock: unaffected by wall-clock changes while running
+        uptime = (timedelta(seconds=int(time.monotonic() - self.start_time))
+                  if self.start_time is not None else None)
 
         print("\n" + "=" * 60)
         print("[STATS] JARVIS STATISTICS")
@@ -322,6 +420,8 @@ class JarvisAssistant:
         self.running = False
         self.print_statistics()
         self.speaker.shutdown()
+        self.brain.close()
+        self.listener.close()
 
         print("Goodbye!")
         logger.info("Shutdown complete")
@@ -0,0 +1,87 @@
+"""
+Pre-quantize Whisper Script
+===========================
+Converts a Whisper model to CTranslate2 format with INT8 weights and saves
+it to disk, so the offline listener loads ready-quantized weights instead
+of quantizing them in memory on every start.
+
+Usage:
+    python scripts/prequantize_whisper.py [--model openai/whisper-base]
+                                          [--output models/whisper-base-int8]
+
+Requires: pip install ctranslate2 transformers[torch]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Allow importing config when run from the scripts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+# ============================================================================
+# LOGGING SETUP
+# ============================================================================
+logger = logging.getLogger(__name__)
+
+# Files faster-whisper needs next to the converted weights
+TOKENIZER_FILES = ["tokenizer.json", "preprocessor_config.json"]
+
+
+def prequantize(model_name: str, output_dir: str, quantization: str = "int8",
+                force: bool = False) -> str:
+    """
+    Convert a Hugging Face Whisper model to a quantized CTranslate2 model.
+
+    Args:
+        model_name: Hugging Face model id (e.g. "openai/whisper-base")
+        output_dir: Directory to write the converted model to
+        quantization: Weight type to store (int8, int8_float16, float16...)
+        force: Overwrite an existing output directory
+
+    Returns:
+        Path of the converted model directory
+    """
+    from ctranslate2.converters import TransformersConverter
+
+    converter = TransformersConverter(model_name, copy_files=TOKENIZER_FILES)
+    path = converter.convert(output_dir, quantization=quantization, force=force)
+    logger.info("Saved %s (%s) to %s", model_name, quantization, path)
+    return path
+
+
+def main() -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=f"openai/whisper-{config.WHISPER_SIZE}",
+                        help="Hugging Face model id (default: %(default)s)")
+    parser.add_argument("--output", default=config.WHISPER_MODEL_DIR,
+                        help="Output directory (default: %(default)s)")
+    parser.add_argument("--quantization", default="int8",
+                        help="Weight type to store (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="Overwrite the output directory if it exists")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format=config.LOG_FORMAT)
+
+    try:
+        prequantize(args.model, args.output, args.quantization, args.force)
+    except ImportError:
+        logger.error("ctranslate2 and transformers are required: "
+                     "pip install ctranslate2 transformers[torch]")
+        return 1
+    except Exception as exc:
+        logger.error("Conversion failed: %s", exc)
+        return 1
+
+    print(f"Model ready. Listener loads it from {args.output} when "
+          f"USE_OFFLINE_RECOGNITION=true.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,49 +3,48 @@
 Simple Integration Test for Jarvis AI Assistant
 """
 
+import importlib
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# JARVIS_SMOKE_ONLY=1 skips the round-trips to the language model, which
+# take seconds each, so the remaining checks finish in about a second
+SMOKE_ONLY = os.environ.get("JARVIS_SMOKE_ONLY") == "1"
 
 print("=" * 60)
 print("JARVIS AI ASSISTANT - INTEGRATION TEST")
 print("=" * 60)
 
 # Test 1: Import all modules
+# Imports run in parallel so their file reads and extension loading overlap
 print("\n[TEST 1] Module Imports...")
-try:
-    import config
-    print("[OK] Config imported")
-except Exception as e:
-    print(f"[FAIL] Config: {e}")
-    sys.exit(1)
-
-try:
-    from brain import Brain
-    print("[OK] Brain imported")
-except Exception as e:
-    print(f"[FAIL] Brain: {e}")
-    sys.exit(1)
-
-try:
-    from listen import Listener
-    print("[OK] Listener imported")
-except Exception as e:
-    print(f"[FAIL] Listener: {e}")
-    sys.exit(1)
+MODULES = [
+    ("config", "Config"),
+    ("brain", "Brain"),
+    ("listen", "Listener"),
+    ("speak", "Speaker"),
+    ("skills", "Skills"),
+]
+with ThreadPoolExecutor(max_workers=len(MODULES)) as executor:
+    futures = {name: executor.submit(importlib.import_module, name)
+               for name, _ in MODULES}
 
-try:
-    from speak import Speaker
-    print("[OK] Speaker imported")
-except Exception as e:
-    print(f"[FAIL] Speaker: {e}")
-    sys.exit(1)
+modules = {}
+for name, label in MODULES:
+    try:
+        modules[name] = futures[name].result()
+        print(f"[OK] {label} imported")
+    except Exception as e:
+        print(f"[FAIL] {label}: {e}")
+        sys.exit(1)
 
-try:
-    import skills
-    print("[OK] Skills imported")
-except Exception as e:
-    print(f"[FAIL] Skills: {e}")
-    sys.exit(1)
+config = modules["config"]
+Brain = modules["brain"].Brain
+Listener = modules["listen"].Listener
+Speaker = modules["speak"].Speaker
+skills = modules["skills"]
 
 # Test 2: Configuration
 print("\n[TEST 2] Configuration...")
@@ -72,11 +71,14 @@ try:
     print(f"  History: {stats['history_length']}")
     
     # Test chat (will fail if Ollama not running)
-    try:
-        response = brain.chat("Hello test")
-        print(f"[OK] AI chat: {response[:30]}...")
-    except Exception:
-        print("[WARN] AI chat failed (Ollama not running)")
+    if SMOKE_ONLY:
+        print("[SKIP] chat (smoke-only mode)")
+    else:
+        try:
+            response = brain.chat("Hello test")
+            print(f"[OK] AI chat: {response[:30]}...")
+        except Exception:
+            print("[WARN] AI chat failed (Ollama not running)")
         
 except Exception as e:
     print(f"[FAIL] Brain test: {e}")
@@ -132,7 +134,7 @@ try:
     key_skills = ['time', 'date', 'open', 'hardware']
     for skill in key_skills:
         if skill in skills.SKILLS:
-            print(f"  {skill}: {skills.SKILLS[skill].__name__}")
+            print(f"  {skill}: {skills.skill_name(skills.SKILLS[skill])}")
     
 except Exception as e:
     print(f"[FAIL] Skills test: {e}")
@@ -142,9 +144,12 @@ except Exception as e:
 print("\n[TEST 7] Communication...")
 try:
     # Brain to Speaker
-    brain_response = brain.chat("What time is it?")
-    speaker.say(brain_response[:30], block=False)
-    print("[OK] Brain -> Speaker")
+    if SMOKE_ONLY:
+        print("[SKIP] chat (smoke-only mode)")
+    else:
+        brain_response = brain.chat("What time is it?")
+        speaker.say(brain_response[:30], block=False)
+        print("[OK] Brain -> Speaker")
     
     # Skills to Speaker
     skill_response = skills.get_time()
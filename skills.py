@@ -12,20 +12,34 @@ Key Features:
 - Extensible skill system
 """
 
-from datetime import datetime
+from functools import partial
+import http.client
 import os
 import platform
+import socket
 import subprocess
+import threading
+import time
+import urllib.parse
 import logging
-from typing import Callable, Dict, Any, Optional, List
-import requests
+from typing import Callable, Dict, Any, Iterator, Optional, List, Set, Tuple
 import config
+from _matcher import PhraseMatcher
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# PLATFORM DETAILS
+# ============================================================================
+# Looked up once; they cannot change while the process runs
+_SYSTEM_NAME = platform.system()
+_SYSTEM = _SYSTEM_NAME.lower()
+_SYSTEM_RELEASE = platform.release()
+_SYSTEM_MACHINE = platform.machine()
+
 
 # ============================================================================
 # SKILL CATEGORIES
@@ -34,6 +48,97 @@ logger = logging.getLogger(__name__)
 # ===========================================================================
 # CATEGORY: APPLICATION CONTROL
 # ===========================================================================
+# config.APP_PATHS keyed by lowercase app name, so "Chrome" in the config
+# matches "open chrome". _VALID_APP_PATHS holds only the entries whose path
+# exists, checked once when the paths are loaded rather than on each launch.
+_APP_PATHS_LC: Dict[str, str] = {}
+_VALID_APP_PATHS: Dict[str, str] = {}
+
+
+def _list_dir(directory: str) -> Set[str]:
+    """
+    List the entry names in a directory, normalized for case comparison.
+
+    Args:
+        directory: Directory to list ("" means the current directory)
+
+    Returns:
+        Set of normalized entry names (empty if the directory is unreadable)
+    """
+    try:
+        with os.scandir(directory or ".") as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
+
+def reload_app_paths() -> None:
+    """
+    Rebuild the app path lookup from config.APP_PATHS.
+
+    Call this after changing config.APP_PATHS at runtime, or after
+    installing or moving an app. Missing paths are logged here, once,
+    instead of on every launch attempt.
+    """
+    global _APP_PATHS_LC, _VALID_APP_PATHS
+    _APP_PATHS_LC = {name.lower().strip(): path
+                     for name, path in config.APP_PATHS.items()}
+
+    # Each directory is listed once, so apps sharing a folder cost one
+    # scandir instead of one stat() each
+    valid: Dict[str, str] = {}
+    listings: Dict[str, Set[str]] = {}
+    for name, path in _APP_PATHS_LC.items():
+        directory, filename = os.path.split(path)
+        if not filename:
+            exists = os.path.exists(path)
+        else:
+            if directory not in listings:
+                listings[directory] = _list_dir(directory)
+            exists = os.path.normcase(filename) in listings[directory]
+
+        if exists:
+            valid[name] = path
+        else:
+            logger.warning("Configured path for %s not found: %s", name, path)
+    _VALID_APP_PATHS = valid
+
+
+reload_app_paths()
+
+# Launched apps are fully detached from Jarvis: no inherited stdio or file
+# descriptors, and their own session/process group so they outlive Jarvis
+if _SYSTEM == "windows":
+    _DETACH_KWARGS: Dict[str, Any] = {
+        "creationflags": (getattr(subprocess, "DETACHED_PROCESS", 0)
+                          | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)),
+    }
+else:
+    _DETACH_KWARGS = {"start_new_session": True}
+
+
+def _launch_detached(args: List[str], **kwargs: Any) -> subprocess.Popen:
+    """
+    Start a process detached from Jarvis.
+
+    Args:
+        args: Command line to run
+        **kwargs: Extra arguments for subprocess.Popen
+
+    Returns:
+        The started process
+    """
+    return subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **_DETACH_KWARGS,
+        **kwargs
+    )
+
+
 def open_app(app_name: str) -> str:
     """
     Open an application using the most appropriate method for the OS.
@@ -54,45 +159,49 @@ def open_app(app_name: str) -> str:
     # ========================================================================
     # STEP 1: Normalize app name for lookup
     # ========================================================================
-    system = platform.system().lower()
+    system = _SYSTEM
     lookup_key = app_name.lower().strip()
 
     # ========================================================================
     # STEP 2: Try configured path first (most reliable)
     # ========================================================================
-    app_path = config.APP_PATHS.get(lookup_key)
+    app_path = _VALID_APP_PATHS.get(lookup_key)
 
     if app_path:
-        # Check if configured path actually exists
-        if os.path.exists(app_path):
-            try:
-                subprocess.Popen([app_path])
-                logger.info("Opened %s from configured path", lookup_key)
-                return f"Opening {app_name}."
-            except Exception as exc:
-                logger.error("Failed to open %s: %s", lookup_key, exc)
-                return f"Failed to open {app_name}: {exc}"
-        else:
-            logger.warning("Configured path for %s not found: %s", lookup_key, app_path)
-            return f"The configured path for {app_name} was not found. Please update your configuration."
+        try:
+            _launch_detached([app_path])
+            logger.info("Opened %s from configured path", lookup_key)
+            return f"Opening {app_name}."
+        except Exception as exc:
+            logger.error("Failed to open %s: %s", lookup_key, exc)
+            return f"Failed to open {app_name}: {exc}"
+
+    if lookup_key in _APP_PATHS_LC:
+        # Configured, but the path was missing when the paths were loaded
+        return f"The configured path for {app_name} was not found. Please update your configuration."
 
     # ========================================================================
     # STEP 3: Try OS-specific launch command
     # ========================================================================
     try:
         if system == "windows":
-            # Windows: use 'start' command
-            subprocess.Popen(["start", "", app_name], shell=True)
-            logger.info("Opened %s using Windows start command", app_name)
+            # Windows: ask the shell API directly, without spawning cmd.exe;
+            # fall back to the 'start' command if the name isn't registered
+            try:
+                os.startfile(app_name)
+                logger.info("Opened %s using os.startfile", app_name)
+            except OSError:
+                _launch_detached(["start", "", app_name], shell=True)
+                logger.info("Opened %s using Windows start command", app_name)
 
         elif system == "darwin":
             # macOS: use 'open' command
-            subprocess.Popen(["open", "-a", app_name])
+            _launch_detached(["open", "-a", app_name])
             logger.info("Opened %s using macOS open command", app_name)
 
         else:
             # Linux and others: try direct execution
-            subprocess.Popen([app_name])
+            _launch_detached([app_name])
             logger.info("Opened %s using direct execution", app_name)
 
         return f"Opening {app_name}."
@@ -117,31 +226,56 @@ def close_app(app_name: str) -> str:
     Returns:
         Status message
     """
-    system = platform.system().lower()
-
-    try:
-        if system == "windows":
-            subprocess.run(["taskkill", "/IM", f"{app_name}.exe", "/F"],
-                           capture_output=True, check=True)
-        elif system == "darwin":
-            subprocess.run(["pkill", "-f", app_name], check=True)
-        else:
-            subprocess.run(["pkill", app_name], check=True)
+    system = _SYSTEM
 
-        logger.info("Closed application: %s", app_name)
-        return f"Closed {app_name}."
+    if system == "windows":
+        command = ["taskkill", "/IM", f"{app_name}.exe", "/F"]
+    elif system == "darwin":
+        command = ["pkill", "-f", app_name]
+    else:
+        command = ["pkill", app_name]
 
-    except subprocess.CalledProcessError:
-        logger.warning("Could not close %s - may not be running", app_name)
-        return f"{app_name} is not running or could not be closed."
+    try:
+        # A non-zero exit just means nothing matched, which is expected, so
+        # the return code is checked instead of raising CalledProcessError
+        result = subprocess.run(command, capture_output=True, check=False)
     except Exception as exc:
         logger.error("Error closing %s: %s", app_name, exc)
         return f"Failed to close {app_name}: {exc}"
 
+    if result.returncode != 0:
+        logger.warning("Could not close %s - may not be running", app_name)
+        return f"{app_name} is not running or could not be closed."
+
+    logger.info("Closed application: %s", app_name)
+    return f"Closed {app_name}."
+
 
 # ===========================================================================
 # CATEGORY: TIME AND DATE
 # ===========================================================================
+# strftime formats for the spoken time and date
+_TIME_FMT = "%I:%M %p"
+_DATE_FMT = "%A, %B %d, %Y"
+_DATETIME_FMT = f"It's {_TIME_FMT} on {_DATE_FMT}"
+
+
+def _format_now(fmt: str) -> str:
+    """
+    Format the current local time.
+
+    Uses time.strftime on time.localtime(), which skips building a
+    datetime object for each request.
+
+    Args:
+        fmt: strftime format string
+
+    Returns:
+        Formatted current time
+    """
+    return time.strftime(fmt, time.localtime())
+
+
 def get_time() -> str:
     """
     Get the current time in 12-hour format.
@@ -149,7 +283,7 @@ def get_time() -> str:
     Returns:
         Formatted time string (e.g., "02:30 PM")
     """
-    current_time = datetime.now().strftime("%I:%M %p")
+    current_time = _format_now(_TIME_FMT)
     logger.debug("Time requested: %s", current_time)
     return f"The time is {current_time}"
 
@@ -161,7 +295,7 @@ def get_date() -> str:
     Returns:
         Formatted date string (e.g., "Monday, January 15, 2024")
     """
-    current_date = datetime.now().strftime("%A, %B %d, %Y")
+    current_date = _format_now(_DATE_FMT)
     logger.debug("Date requested: %s", current_date)
     return f"Today is {current_date}"
 
@@ -173,15 +307,90 @@ def get_datetime() -> str:
     Returns:
         Combined date and time string
     """
-    now = datetime.now()
-    date_str = now.strftime("%A, %B %d, %Y")
-    time_str = now.strftime("%I:%M %p")
-    return f"It's {time_str} on {date_str}"
+    # One format call, so date and time come from the same instant
+    return _format_now(_DATETIME_FMT)
 
 
 # ===========================================================================
 # CATEGORY: HARDWARE CONTROL
 # ===========================================================================
+# Connection to the hardware endpoint, opened on first use and kept alive
+# between commands. The ESP32 is a plain-HTTP LAN device, so the standard
+# library client is enough and "requests" is never imported for it.
+_hw_conn: Optional[http.client.HTTPConnection] = None
+# (ESP32_IP, HARDWARE_TIMEOUT) the connection was opened with; a change in
+# config makes the next command reconnect
+_hw_target: Optional[Tuple[str, float]] = None
+_hw_lock = threading.Lock()
+
+# Errors meaning the device closed a kept-alive connection while it sat idle
+_HW_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def _hw_send(path: str) -> Tuple[int, str]:
+    """
+    Send one GET request, opening the connection if needed. Caller holds _hw_lock.
+
+    Args:
+        path: Request path without the leading slash
+
+    Returns:
+        Tuple of (HTTP status code, response body)
+    """
+    global _hw_conn, _hw_target
+
+    if _hw_conn is None:
+        _hw_target = (config.ESP32_IP, config.HARDWARE_TIMEOUT)
+        _hw_conn = http.client.HTTPConnection(
+            config.ESP32_IP, timeout=config.HARDWARE_TIMEOUT)
+    try:
+        # Spoken actions may hold spaces or non-ASCII characters,
+        # which http.client rejects in a raw request line
+        _hw_conn.request("GET", "/" + urllib.parse.quote(path))
+        response = _hw_conn.getresponse()
+        body = response.read().decode("utf-8", errors="replace")
+    except (http.client.HTTPException, OSError):
+        _hw_conn.close()
+        _hw_conn = None
+        raise
+
+    if response.will_close:
+        _hw_conn.close()
+        _hw_conn = None
+    return response.status, body
+
+
+def _hw_get(path: str) -> Tuple[int, str]:
+    """
+    Send a GET request to the hardware endpoint.
+
+    The connection is reopened if config.ESP32_IP or HARDWARE_TIMEOUT has
+    changed since it was opened, and once more if the device has closed a
+    kept-alive connection in the meantime; other errors are raised to the
+    caller.
+
+    Args:
+        path: Request path without the leading slash (percent-encoded here)
+
+    Returns:
+        Tuple of (HTTP status code, response body)
+    """
+    global _hw_conn
+
+    with _hw_lock:
+        if _hw_conn is not None and _hw_target != (config.ESP32_IP, config.HARDWARE_TIMEOUT):
+            _hw_conn.close()
+            _hw_conn = None
+
+        reused = _hw_conn is not None
+        try:
+            return _hw_send(path)
+        except _HW_STALE_ERRORS:
+            if not reused:
+                raise
+        return _hw_send(path)
+
+
 def control_hardware(action: str = "status") -> str:
     """
     Send commands to ESP32 or other connected hardware.
@@ -204,47 +413,43 @@ def control_hardware(action: str = "status") -> str:
     if not config.ENABLE_HARDWARE_CONTROL:
         return "Hardware control is currently disabled."
 
-    # ========================================================================
-    # STEP 1: Build request URL
-    # ========================================================================
-    url = f"http://{config.ESP32_IP}/{action}"
     logger.info("Sending hardware command: %s to %s", action, config.ESP32_IP)
 
     # ========================================================================
-    # STEP 2: Send HTTP request to hardware
+    # STEP 1: Send HTTP request to hardware
     # ========================================================================
     try:
-        response = requests.get(
-            url,
-            timeout=config.HARDWARE_TIMEOUT
-        )
-        response.raise_for_status()
-
-        # ====================================================================
-        # STEP 3: Process response
-        # ====================================================================
-        body = response.text.strip()
-
-        if body:
-            logger.info("Hardware response: %s", body)
-            return body
-        else:
-            logger.info("Hardware responded with status %d", response.status_code)
-            return f"Hardware command executed successfully (status {response.status_code})."
+        status, body = _hw_get(action)
 
-    except requests.Timeout:
+    except socket.timeout:
         logger.error("Hardware request timed out")
         return f"Hardware did not respond within {config.HARDWARE_TIMEOUT} seconds."
 
-    except requests.ConnectionError:
+    except OSError:
         logger.error("Could not connect to hardware at %s", config.ESP32_IP)
         return (f"Could not connect to hardware at {config.ESP32_IP}. "
                 f"Please check the IP address and network connection.")
 
-    except requests.RequestException as exc:
+    except http.client.HTTPException as exc:
         logger.error("Hardware control failed: %s", exc)
         return f"Hardware control failed: {exc}"
 
+    # ========================================================================
+    # STEP 2: Process response
+    # ========================================================================
+    if status >= 400:
+        logger.error("Hardware returned HTTP %d", status)
+        return f"Hardware control failed: HTTP {status}"
+
+    body = body.strip()
+
+    if body:
+        logger.info("Hardware response: %s", body)
+        return body
+    else:
+        logger.info("Hardware responded with status %d", status)
+        return f"Hardware command executed successfully (status {status})."
+
 
 # ===========================================================================
 # CATEGORY: SYSTEM INFORMATION
@@ -256,17 +461,21 @@ def get_system_info() -> str:
     Returns:
         System info string with OS, platform, and Python version
     """
-    system = platform.system()
-    release = platform.release()
-    machine = platform.machine()
-
-    info = (f"Running on {system} {release}, "
-            f"{machine} architecture")
+    info = (f"Running on {_SYSTEM_NAME} {_SYSTEM_RELEASE}, "
+            f"{_SYSTEM_MACHINE} architecture")
 
     logger.debug("System info: %s", info)
     return info
 
 
+_NO_BATTERY_MSG = "Battery information is not available on this system."
+
+# Why battery status can never be reported here (psutil missing, or no
+# battery), learned once; later calls return it without asking psutil again.
+# None while a battery may be present.
+_battery_unavailable: Optional[str] = None
+
+
 def get_battery_status() -> str:
     """
     Get battery status (if available).
@@ -274,12 +483,27 @@ def get_battery_status() -> str:
     Returns:
         Battery level and charging status, or unavailable message
     """
+    global _battery_unavailable
+
+    if _battery_unavailable is not None:
+        return _battery_unavailable
+
     try:
         import psutil
+    except ImportError:
+        _battery_unavailable = "Battery monitoring requires psutil package."
+        return _battery_unavailable
+
+    try:
         battery = psutil.sensors_battery()
 
         if battery is None:
-            return "Battery information is not available on this system."
+            # A single None can be a failed read on a laptop; only a second
+            # one in a row is taken to mean there is no battery at all
+            battery = psutil.sensors_battery()
+            if battery is None:
+                _battery_unavailable = _NO_BATTERY_MSG
+                return _battery_unavailable
 
         percent = battery.percent
         plugged = "charging" if battery.power_plugged else "not charging"
@@ -287,8 +511,6 @@ def get_battery_status() -> str:
         logger.debug("Battery: %d%% (%s)", percent, plugged)
         return f"Battery is at {percent}% and {plugged}."
 
-    except ImportError:
-        return "Battery monitoring requires psutil package."
     except Exception as exc:
         logger.error("Error getting battery status: %s", exc)
         return f"Could not get battery status: {exc}"
@@ -297,6 +519,26 @@ def get_battery_status() -> str:
 # ===========================================================================
 # CATEGORY: WEB AND NETWORK
 # ===========================================================================
+# Default browser controller, resolved on the first search. Browser
+# discovery can shell out (xdg-settings on Linux), so it is done once.
+_browser = None
+
+
+def _get_browser():
+    """
+    Get the default browser controller, resolving it on first use.
+
+    Returns:
+        webbrowser controller for the default browser
+    """
+    global _browser
+
+    if _browser is None:
+        import webbrowser
+        _browser = webbrowser.get()
+    return _browser
+
+
 def search_web(query: str) -> str:
     """
     Open web browser with search query (requires ENABLE_WEB_SEARCH flag).
@@ -310,11 +552,9 @@ def search_web(query: str) -> str:
     if not config.ENABLE_WEB_SEARCH:
         return "Web search is currently disabled."
 
-    import webbrowser
-
     try:
         search_url = f"https://www.google.com/search?q={query}"
-        webbrowser.open(search_url)
+        _get_browser().open(search_url)
         logger.info("Opened web search for: %s", query)
         return f"Searching the web for {query}."
     except Exception as exc:
@@ -325,6 +565,51 @@ def search_web(query: str) -> str:
 # ===========================================================================
 # CATEGORY: VOLUME CONTROL
 # ===========================================================================
+# Windows endpoint volume interface, acquired once and reused; setting up
+# the COM objects costs far more than the volume call itself
+_volume_iface = None
+_volume_init_failed = False  # pycaw/comtypes not installed
+_volume_lock = threading.Lock()
+
+
+def _get_volume_iface():
+    """
+    Get the cached Windows speaker volume interface.
+
+    Returns:
+        IAudioEndpointVolume pointer, or None if pycaw is not installed
+    """
+    global _volume_iface, _volume_init_failed
+
+    if _volume_iface is not None or _volume_init_failed:
+        return _volume_iface
+
+    with _volume_lock:
+        if _volume_iface is None and not _volume_init_failed:
+            try:
+                from ctypes import cast, POINTER
+                from comtypes import CLSCTX_ALL
+                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+            except ImportError as import_err:
+                logger.debug("Volume control imports failed: %s", import_err)
+                _volume_init_failed = True
+                return None
+
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            _volume_iface = cast(interface, POINTER(IAudioEndpointVolume))
+            logger.debug("Windows volume interface acquired")
+
+    return _volume_iface
+
+
+def _reset_volume_iface() -> None:
+    """Drop the cached volume interface so the next call acquires it again."""
+    global _volume_iface
+    with _volume_lock:
+        _volume_iface = None
+
+
 def adjust_volume(direction: str = "up") -> str:
     """
     Adjust system volume (platform-dependent).
@@ -335,37 +620,16 @@ def adjust_volume(direction: str = "up") -> str:
     Returns:
         Status message
     """
-    system = platform.system().lower()
+    system = _SYSTEM
 
     try:
         if system == "windows":
-            # Windows volume control via nircmd (if installed)
-            # Or use ctypes for volume control
-            # #region agent log
-            try:
-                with open(r"d:\# CODE\1 CODE\.vscode\Arduino Project\ai\.cursor\debug.log", "a") as f:
-                    import json as json_module
-                    f.write(json_module.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "skills.py:adjust_volume:341", "message": "Before optional imports", "data": {"system": system}, "timestamp": __import__("time").time() * 1000}) + "\n")
-            except: pass
-            # #endregion
-            try:
-                from ctypes import cast, POINTER
-                from comtypes import CLSCTX_ALL
-                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                # #region agent log
-                try:
-                    with open(r"d:\# CODE\1 CODE\.vscode\Arduino Project\ai\.cursor\debug.log", "a") as f:
-                        import json as json_module
-                        f.write(json_module.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "skills.py:adjust_volume:344", "message": "Optional imports successful", "data": {}, "timestamp": __import__("time").time() * 1000}) + "\n")
-                except: pass
-                # #endregion
-                
-                # Use the imported modules
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(
-                    IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                volume = cast(interface, POINTER(IAudioEndpointVolume))
+            # Windows volume control via pycaw (COM endpoint volume)
+            volume = _get_volume_iface()
+            if volume is None:
+                return "Volume control requires additional packages for your system."
 
+            try:
                 if direction == "up":
                     current = volume.GetMasterVolumeLevelScalar()
                     volume.SetMasterVolumeLevelScalar(min(1.0, current + 0.1), None)
@@ -377,15 +641,10 @@ def adjust_volume(direction: str = "up") -> str:
                 elif direction == "mute":
                     volume.SetMute(1, None)
                     return "Volume muted."
-            except ImportError as import_err:
-                # #region agent log
-                try:
-                    with open(r"d:\# CODE\1 CODE\.vscode\Arduino Project\ai\.cursor\debug.log", "a") as f:
-                        import json as json_module
-                        f.write(json_module.dumps({"sessionId": "debug-session", "runId": "run1", "hypothesisId": "D", "location": "skills.py:adjust_volume:362", "message": "Optional imports failed", "data": {"error": str(import_err)}, "timestamp": __import__("time").time() * 1000}) + "\n")
-                except: pass
-                # #endregion
-                return "Volume control requires additional packages for your system."
+            except Exception:
+                # The default device may have changed; acquire it again next time
+                _reset_volume_iface()
+                raise
 
         elif system == "darwin":
             # macOS volume control
@@ -428,6 +687,7 @@ Longer keywords are matched first to handle phrases like "what time" vs "time".
 Add new skills by:
 1. Defining a function above
 2. Adding an entry here: "keyword": function_name
+   (use partial(function_name, arg) to bind fixed arguments)
 """
 
 SKILLS: Dict[str, Callable[..., Any]] = {
@@ -449,9 +709,9 @@ SKILLS: Dict[str, Callable[..., Any]] = {
 
     # Hardware Control
     "hardware": control_hardware,
-    "lights": lambda: control_hardware("lights"),
-    "turn on": lambda: control_hardware("on"),
-    "turn off": lambda: control_hardware("off"),
+    "lights": partial(control_hardware, "lights"),
+    "turn on": partial(control_hardware, "on"),
+    "turn off": partial(control_hardware, "off"),
 
     # System Information
     "system info": get_system_info,
@@ -462,12 +722,65 @@ SKILLS: Dict[str, Callable[..., Any]] = {
     "google": search_web,
 
     # Volume Control
-    "volume up": lambda: adjust_volume("up"),
-    "volume down": lambda: adjust_volume("down"),
-    "mute": lambda: adjust_volume("mute"),
+    "volume up": partial(adjust_volume, "up"),
+    "volume down": partial(adjust_volume, "down"),
+    "mute": partial(adjust_volume, "mute"),
 }
 
 
+# ============================================================================
+# SKILL MATCHING
+# ============================================================================
+# Compiled matcher over the SKILLS keywords (Aho-Corasick when pyahocorasick
+# is installed). Rebuilt by _rebuild_automaton() whenever skills are
+# registered or removed, never per command.
+SKILLS_MATCHER = PhraseMatcher.build(())
+
+# Skill keywords, longest first; kept in step with SKILLS_MATCHER
+_KEYWORDS_BY_LEN: Tuple[str, ...] = ()
+
+
+def _rebuild_automaton() -> None:
+    """Rebuild SKILLS_MATCHER and _KEYWORDS_BY_LEN from the current SKILLS keys."""
+    global SKILLS_MATCHER, _KEYWORDS_BY_LEN
+    SKILLS_MATCHER = PhraseMatcher.build(SKILLS.keys())
+    _KEYWORDS_BY_LEN = SKILLS_MATCHER.phrases
+
+
+def match_skill(text: str) -> Optional[Tuple[str, Callable[..., Any]]]:
+    """
+    Find the skill whose keyword best matches the text.
+
+    All keywords contained in the text are found in a single pass, and the
+    longest one wins, so "what time" is preferred over "time".
+
+    Args:
+        text: User command (case-insensitive)
+
+    Returns:
+        (keyword, function) tuple, or None if no keyword matches
+    """
+    keyword = SKILLS_MATCHER.match_longest(text.lower())
+    if keyword is None or keyword not in SKILLS:
+        return None
+    return keyword, SKILLS[keyword]
+
+
+def iter_keywords_longest_first() -> Iterator[str]:
+    """
+    Iterate over the skill keywords, longest first.
+
+    The order is computed when skills change, not on each call.
+
+    Returns:
+        Iterator over keywords in descending length
+    """
+    return iter(_KEYWORDS_BY_LEN)
+
+
+_rebuild_automaton()
+
+
 # ============================================================================
 # SKILL MANAGEMENT FUNCTIONS
 # ============================================================================
@@ -481,6 +794,7 @@ def register_skill(keyword: str, function: Callable) -> None:
         function: Function to call when keyword is detected
     """
     SKILLS[keyword.lower()] = function
+    _rebuild_automaton()
     logger.info("Registered new skill: %s", keyword)
 
 
@@ -497,11 +811,25 @@ def unregister_skill(keyword: str) -> bool:
     keyword_lower = keyword.lower()
     if keyword_lower in SKILLS:
         del SKILLS[keyword_lower]
+        _rebuild_automaton()
         logger.info("Unregistered skill: %s", keyword)
         return True
     return False
 
 
+def skill_name(func: Callable[..., Any]) -> str:
+    """
+    Get a readable name for a skill function.
+
+    Args:
+        func: Skill function or functools.partial wrapping one
+
+    Returns:
+        Name of the underlying function
+    """
+    return getattr(func, "func", func).__name__
+
+
 def list_skills() -> List[str]:
     """
     Get list of all registered skill keywords.
@@ -517,11 +845,12 @@ def get_skill_info() -> Dict[str, str]:
     Get information about all registered skills.
 
     Returns:
-        Dictionary mapping keywords to function names
+        Dictionary mapping keywords to function names, longest keyword first
+        (the order in which they win a match)
     """
     return {
-        keyword: func.__name__
-        for keyword, func in SKILLS.items()
+        keyword: skill_name(SKILLS[keyword])
+        for keyword in iter_keywords_longest_first()
     }
 
 
@@ -530,5 +859,5 @@ def print_skills() -> None:
     print("\n=== Available Skills ===")
     for keyword in sorted(SKILLS.keys()):
         func = SKILLS[keyword]
-        print(f"  {keyword:20} -> {func.__name__}")
+        print(f"  {keyword:20} -> {skill_name(func)}")
     print("========================\n")
\ No newline at end of file
@@ -12,19 +12,212 @@ Key Features:
 - Speech progress monitoring
 """
 
-from typing import Optional, List
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Mapping, Optional, List, Tuple
+import hashlib
+import os
 import threading
 import logging
-import queue
-import time
+import re
 import pyttsx3
 import config
 
+# Optional: simpleaudio plays cached WAV files (pip install simpleaudio).
+# Without it every utterance is synthesized and spoken by the engine.
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# SENTENCE SPLITTING
+# ============================================================================
+# Long replies are spoken sentence by sentence, so the first sentence is
+# heard while the rest are still waiting instead of after the whole text
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Markdown characters language models put in replies, which TTS engines
+# would read out or stumble over; removed in one str.translate() pass
+_STRIP_TABLE = str.maketrans("", "", "*_`#")
+
+# Words whose trailing period does not end a sentence
+_ABBREVIATIONS = frozenset({"dr.", "mr.", "mrs.", "ms.", "st.", "jr.", "sr.",
+                            "vs.", "e.g.", "i.e."})
+
+# Shorter fragments are joined to their neighbour ("Ok." "Yes.")
+MIN_SENTENCE_LENGTH = 10
+
+# Most queued sentences handed to the engine in one runAndWait() call
+MAX_SPEECH_BATCH = 8
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences for speaking one at a time.
+
+    Markdown markup is removed first. Splits after ".", "!" or "?"
+    followed by whitespace, so decimals such as "3.5" stay intact. Common
+    abbreviations do not end a sentence, and fragments shorter than
+    MIN_SENTENCE_LENGTH are merged with the next.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of sentences (empty if nothing speakable is left)
+    """
+    sentences: List[str] = []
+    buffer = ""
+
+    text = text.translate(_STRIP_TABLE).strip()
+    if not text:
+        return sentences
+
+    for part in _SENTENCE_END_RE.split(text):
+        buffer = f"{buffer} {part}" if buffer else part
+        if (len(buffer) < MIN_SENTENCE_LENGTH
+                or buffer.rsplit(None, 1)[-1].lower() in _ABBREVIATIONS):
+            continue
+        sentences.append(buffer)
+        buffer = ""
+
+    if buffer:
+        if sentences and len(buffer) < MIN_SENTENCE_LENGTH:
+            sentences[-1] = f"{sentences[-1]} {buffer}"
+        else:
+            sentences.append(buffer)
+
+    return sentences
+
+
+# ============================================================================
+# SPEECH CACHE
+# ============================================================================
+class SpeechCache:
+    """
+    Disk cache of synthesized speech, one WAV file per utterance.
+
+    Files are keyed by the text and the voice settings, and the least
+    recently used files are deleted once the cache grows past its size cap.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """
+        Open the cache directory, indexing files left by earlier runs.
+
+        Args:
+            directory: Directory holding the WAV files
+            max_bytes: Total size above which old files are evicted
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+
+        # key -> file size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".part"):
+                    # Left by a synthesis that never finished
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+                elif entry.name.endswith(".wav") and entry.is_file():
+                    files.append(entry)
+        for entry in sorted(files, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._entries[entry.name[:-4]] = size
+            self.total_bytes += size
+
+    @staticmethod
+    def make_key(text: str, voice: Optional[str], rate: int, volume: float) -> str:
+        """
+        Build the cache key for an utterance.
+
+        Args:
+            text: Text being spoken
+            voice: Voice ID
+            rate: Speaking rate
+            volume: Volume level
+
+        Returns:
+            Hex digest identifying the synthesized audio
+        """
+        raw = f"{text}\0{voice}\0{rate}\0{volume}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        """Check for a cached entry without counting a hit."""
+        return key in self._entries
+
+    def path_for(self, key: str) -> str:
+        """Get the WAV file path for a key."""
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached utterance and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Path of the WAV file, or None on a miss
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self.path_for(key)
+
+    def add(self, key: str) -> None:
+        """
+        Record a WAV file written to path_for(key), evicting old entries.
+
+        Args:
+            key: Cache key of the new file
+        """
+        size = os.path.getsize(self.path_for(key))
+
+        with self._lock:
+            self.total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+                try:
+                    os.unlink(self.path_for(old_key))
+                except OSError:
+                    pass
+
+    def discard(self, key: str) -> None:
+        """
+        Remove an entry, e.g. a file that turned out to be unplayable.
+
+        Args:
+            key: Cache key to remove
+        """
+        with self._lock:
+            self.total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.unlink(self.path_for(key))
+        except OSError:
+            pass
+
 
 # ============================================================================
 # SPEAKER CLASS - TEXT-TO-SPEECH SYSTEM
@@ -89,48 +282,111 @@ class Speaker:
         if voice_id:
             self.set_voice(voice_id)
 
+        # Current settings, kept in Python so reading them does not go
+        # through the TTS driver; every setter below updates them
+        self._rate = self.engine.getProperty("rate")
+        self._volume = self.engine.getProperty("volume")
+        self._voice = self.engine.getProperty("voice")
+
+        # Installed voices, enumerated on first request (slow on SAPI)
+        self._voices_cache: Optional[Tuple[Mapping[str, Any], ...]] = None
+
         # ====================================================================
         # STEP 3: Initialize state tracking
         # ====================================================================
-        self._speaking = threading.Event()  # Tracks if currently speaking
-        self._speech_queue = queue.Queue()  # Queue for pending speech
+        # Tracks if currently speaking. Written only by the worker (and
+        # stop()); a plain attribute read is atomic, so is_speaking() needs
+        # no synchronization. Blocking waits use _done instead.
+        self._speaking_flag = False
+        self._done = threading.Event()  # Set when no speech is pending
+        self._done.set()
+        self._pending_speech = 0  # say() calls not yet finished
+        self._busy_generation = 0  # Times pending speech went from 0 to 1
+        self._pending_lock = threading.Lock()
+        # Pending speech as (text, done_event) items, spoken in order by one
+        # persistent worker thread. None is a wake-up sentinel used to stop it.
+        # deque append/popleft are atomic, so the only synchronization needed
+        # is _items_event, which is set while the deque may be non-empty.
+        self._speech_queue: Deque[Optional[Tuple[str, threading.Event]]] = deque()
+        self._items_event = threading.Event()
+        # Serializes producers (say, say_immediately, clear_queue); the
+        # worker only consumes and never takes it
+        self._queue_lock = threading.Lock()
         self._queue_thread: Optional[threading.Thread] = None
         self._queue_active = False
         self._current_text: Optional[str] = None
 
-        # Statistics
+        # Disk cache of synthesized speech (only when it can be played back)
+        self._cache: Optional[SpeechCache] = None
+        self._play_obj = None  # simpleaudio playback in progress
+        # Stock phrases already decoded, by cache key (filled by _prewarm)
+        self._hot_audio: Dict[str, Any] = {}
+        # The last sentence played, as (cache key, decoded audio), so a
+        # repeated reply ("I didn't catch that") is replayed from memory
+        self._last_audio: Optional[Tuple[str, Any]] = None
+        # pyttsx3 engines are not reentrant; held around every engine run
+        self._engine_lock = threading.Lock()
+        # Bumped by stop(); a synthesis that sees it change discards its file
+        self._stop_count = 0
+        if config.ENABLE_TTS_CACHE and simpleaudio is not None:
+            try:
+                self._cache = SpeechCache(config.TTS_CACHE_DIR, config.TTS_CACHE_MAX_BYTES)
+                logger.info("Speech cache enabled at %s", config.TTS_CACHE_DIR)
+            except OSError as exc:
+                logger.warning("Speech cache unavailable: %s", exc)
+
+        # Statistics (updated by the worker once per batch)
         self.total_utterances = 0
         self.total_characters = 0
+        self._stats_lock = threading.Lock()
 
         # Log configuration
-        current_rate = self.engine.getProperty("rate")
-        current_volume = self.engine.getProperty("volume")
         logger.info("Speaker configured - Rate: %d, Volume: %.2f",
-                    current_rate, current_volume)
+                    self._rate, self._volume)
+
+        # Start the speech worker now, so say() never waits on thread startup
+        self._start_queue_processor()
+
+        # Synthesize stock phrases in the background, so their first use
+        # is played straight from the cache
+        if self._cache is not None and config.PRECACHE_PHRASES:
+            threading.Thread(
+                target=self._prewarm,
+                args=(config.PRECACHE_PHRASES,),
+                daemon=True,
+                name="SpeechPrewarm"
+            ).start()
 
     # ========================================================================
     # VOICE SELECTION AND CUSTOMIZATION
     # ========================================================================
-    def get_available_voices(self) -> List[dict]:
+    def get_available_voices(self) -> List[Mapping[str, Any]]:
         """
         Get list of available voices on the system.
 
+        The voices are enumerated once and cached; call
+        invalidate_voices_cache() after installing a new voice.
+
         Returns:
-            List of voice dictionaries with id, name, and languages
+            List of read-only voice mappings with id, name, and languages
         """
-        voices = self.engine.getProperty("voices")
-        voice_list = []
-
-        for voice in voices:
-            voice_info = {
-                "id": voice.id,
-                "name": voice.name,
-                "languages": voice.languages,
-                "gender": getattr(voice, "gender", "unknown")
-            }
-            voice_list.append(voice_info)
-
-        return voice_list
+        if self._voices_cache is None:
+            voices = self.engine.getProperty("voices")
+            self._voices_cache = tuple(
+                MappingProxyType({
+                    "id": voice.id,
+                    "name": voice.name,
+                    "languages": voice.languages,
+                    "gender": getattr(voice, "gender", "unknown")
+                })
+                for voice in voices
+            )
+
+        return list(self._voices_cache)
+
+    def invalidate_voices_cache(self) -> None:
+        """Forget the cached voice list so the next request re-enumerates it."""
+        self._voices_cache = None
 
     def set_voice(self, voice_id: str) -> bool:
         """
@@ -144,6 +400,7 @@ class Speaker:
         """
         try:
             self.engine.setProperty("voice", voice_id)
+            self._voice = voice_id
             logger.info("Voice changed to: %s", voice_id)
             return True
         except Exception as exc:
@@ -167,9 +424,10 @@ class Speaker:
         Args:
             change: Amount to increase (positive) or decrease (negative)
         """
-        current_rate = self.engine.getProperty("rate")
+        current_rate = self._rate
         new_rate = max(50, min(300, current_rate + change))  # Clamp 50-300
         self.engine.setProperty("rate", new_rate)
+        self._rate = new_rate
         logger.info("Speaking rate adjusted: %d -> %d", current_rate, new_rate)
 
     def adjust_volume(self, change: float) -> None:
@@ -179,38 +437,64 @@ class Speaker:
         Args:
             change: Amount to increase (positive) or decrease (negative)
         """
-        current_volume = self.engine.getProperty("volume")
+        current_volume = self._volume
         new_volume = max(0.0, min(1.0, current_volume + change))  # Clamp 0-1
         self.engine.setProperty("volume", new_volume)
+        self._volume = new_volume
         logger.info("Volume adjusted: %.2f -> %.2f", current_volume, new_volume)
 
     # ========================================================================
-    # SPEECH EXECUTION - INTERNAL THREAD
+    # SPEECH EXECUTION - WORKER THREAD
     # ========================================================================
-    def _say_thread(self, text: str) -> None:
+    def _speak(self, texts: List[str], stops: int) -> None:
         """
         Internal method that performs the actual TTS operation.
 
-        Runs in a separate thread to avoid blocking the main program.
+        Called on the speech worker thread for each batch of queued items.
         Handles speech execution and state management.
 
         Args:
-            text: Text to speak aloud
+            texts: Sentences to speak aloud, in order
+            stops: _stop_count when the batch was taken from the queue;
+                   a stop() since then cancels whatever is not yet spoken
         """
         try:
             # Mark as speaking
-            self._speaking.set()
+            self._speaking_flag = True
+            if self._stop_count != stops:
+                return
+            text = " ".join(texts)
             self._current_text = text
 
-            logger.debug("Speaking: '%s'", text[:50] + "..." if len(text) > 50 else text)
-
-            # Perform text-to-speech
-            self.engine.say(text)
-            self.engine.runAndWait()
+            # %.50s truncates only when the record is actually formatted
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Speaking: '%.50s%s'", text, "..." if len(text) > 50 else "")
+
+            # Perform text-to-speech. runAndWait() returns only once the
+            # utterances have finished, so no engine.stop() is needed after it.
+            if self._cache is not None:
+                for sentence in texts:
+                    if self._stop_count != stops:
+                        return
+                    if not self._speak_cached(sentence):
+                        with self._engine_lock:
+                            self.engine.say(sentence)
+                            self.engine.runAndWait()
+            else:
+                # One runAndWait() for the whole batch pays the driver's
+                # startup cost once
+                with self._engine_lock:
+                    if self._stop_count != stops:
+                        return
+                    for sentence in texts:
+                        self.engine.say(sentence)
+                    self.engine.runAndWait()
 
             # Update statistics
-            self.total_utterances += 1
-            self.total_characters += len(text)
+            characters = sum(map(len, texts))
+            with self._stats_lock:
+                self.total_utterances += len(texts)
+                self.total_characters += characters
 
             logger.debug("Speech completed")
 
@@ -220,9 +504,153 @@ class Speaker:
 
         finally:
             # Clear speaking state
-            self._speaking.clear()
+            self._speaking_flag = False
             self._current_text = None
 
+    def _cache_key(self, text: str) -> str:
+        """Get the speech cache key for text at the current voice settings."""
+        return self._cache.make_key(text, self._voice, self._rate, self._volume)
+
+    def _synthesize_to_cache(self, text: str, key: str) -> bool:
+        """
+        Synthesize text into the speech cache without playing it.
+
+        Args:
+            text: Text to synthesize
+            key: Cache key for the text
+
+        Returns:
+            True if the cache now holds the audio
+        """
+        path = self._cache.path_for(key)
+        partial_path = path + ".part"
+        try:
+            with self._engine_lock:
+                # The other thread may have cached it while we waited
+                if key in self._cache:
+                    return True
+                stops = self._stop_count
+                self.engine.save_to_file(text, partial_path)
+                self.engine.runAndWait()
+                # stop() may have cut the file short; never cache a fragment
+                if self._stop_count != stops:
+                    os.unlink(partial_path)
+                    return False
+                os.replace(partial_path, path)
+                self._cache.add(key)
+            return True
+        except Exception as exc:
+            logger.debug("Could not cache speech: %s", exc)
+            try:
+                os.unlink(partial_path)
+            except OSError:
+                pass
+            return False
+
+    def _prewarm(self, phrases: List[str]) -> None:
+        """
+        Synthesize stock phrases into the speech cache (prewarm thread).
+
+        Phrases are split the same way say() splits them, so the cached
+        entries match what is later spoken.
+
+        Args:
+            phrases: Phrases to have ready in the cache
+        """
+        added = 0
+        for phrase in phrases:
+            for sentence in _split_sentences(phrase.strip()):
+                key = self._cache_key(sentence)
+                if key not in self._cache:
+                    if not self._synthesize_to_cache(sentence, key):
+                        continue
+                    added += 1
+                # Keep stock phrases decoded in memory as well, so playing
+                # them needs neither a file read nor a WAV parse
+                try:
+                    self._hot_audio[key] = simpleaudio.WaveObject.from_wave_file(
+                        self._cache.path_for(key))
+                except Exception as exc:
+                    logger.debug("Could not load stock phrase audio: %s", exc)
+        logger.debug("Speech cache prewarmed (%d new phrase(s))", added)
+
+    def _read_ahead(self) -> None:
+        """Synthesize the next queued sentence into the cache, if missing."""
+        try:
+            item = self._speech_queue[0]
+        except IndexError:
+            return
+        if item is None:
+            return
+
+        key = self._cache_key(item[0])
+        if key not in self._cache:
+            self._synthesize_to_cache(item[0], key)
+
+    def _speak_cached(self, text: str) -> bool:
+        """
+        Speak text from the speech cache, synthesizing it into the cache
+        first on a miss.
+
+        Args:
+            text: Text to speak aloud
+
+        Returns:
+            True if the text was played, False if the caller should fall
+            back to speaking it through the engine
+        """
+        cache = self._cache
+        key = self._cache_key(text)
+
+        wave_obj = self._hot_audio.get(key)
+        last_audio = self._last_audio
+        if wave_obj is None and last_audio is not None and last_audio[0] == key:
+            wave_obj = last_audio[1]
+        # cache.get() also counts the hit and keeps the file's LRU position
+        # fresh, so it is called even when the audio is already in memory
+        path = cache.get(key)
+        if wave_obj is None and path is None:
+            if not self._synthesize_to_cache(text, key):
+                return False
+            path = cache.path_for(key)
+
+        try:
+            if wave_obj is None:
+                wave_obj = simpleaudio.WaveObject.from_wave_file(path)
+            self._last_audio = (key, wave_obj)
+            self._play_obj = wave_obj.play()
+            # Playback runs on its own; synthesize the next sentence
+            # meanwhile so it is ready the moment this one ends
+            self._read_ahead()
+            self._play_obj.wait_done()
+            return True
+        except Exception as exc:
+            # e.g. a driver that writes AIFF instead of WAV
+            logger.debug("Cached speech not playable, discarding: %s", exc)
+            self._hot_audio.pop(key, None)
+            self._last_audio = None
+            cache.discard(key)
+            return False
+        finally:
+            self._play_obj = None
+
+    def _finish_items(self, done_events: List[threading.Event]) -> None:
+        """
+        Mark queued speech items as finished (spoken or discarded).
+
+        Args:
+            done_events: The items' completion events
+        """
+        # Release anyone blocked in say(block=True) on these items
+        for done_event in done_events:
+            done_event.set()
+
+        # Wake wait_until_done() once the last pending speech finishes
+        with self._pending_lock:
+            self._pending_speech -= len(done_events)
+            if self._pending_speech == 0:
+                self._done.set()
+
     # ========================================================================
     # BASIC SPEECH INTERFACE
     # ========================================================================
@@ -238,38 +666,116 @@ class Speaker:
             text: Text to speak
             block: If True, wait for speech to complete before returning
         """
-        if not text or not text.strip():
-            logger.warning("Attempted to speak empty text")
+        sentences = self._prepare(text)
+        if not sentences:
             return
 
-        # Clean up text for better speech
-        text = text.strip()
+        with self._queue_lock:
+            done_event = self._enqueue(sentences)
 
-        # Create and start speech thread
-        thread = threading.Thread(
-            target=self._say_thread,
-            args=(text,),
-            daemon=True,
-            name="SpeechThread"
-        )
-        thread.start()
+        # Restart the worker if it was stopped
+        if not self._queue_active:
+            self._start_queue_processor()
 
-        # Wait for completion if blocking requested
+        # Wait for completion if blocking requested (items finish in order,
+        # so the last sentence finishing means all of them have)
         if block:
-            thread.join()
+            done_event.wait()
 
     def say_immediately(self, text: str) -> None:
         """
         Stop any current speech and speak new text immediately.
 
         Interrupts current speech and clears queue to speak urgent message.
+        Done as one step under the queue lock, so text queued concurrently
+        by another thread cannot slip in ahead of the urgent message.
 
         Args:
             text: Urgent text to speak
         """
-        self.stop()
-        self.clear_queue()
-        self.say(text, block=False)
+        sentences = self._prepare(text)
+        if not sentences:
+            return
+
+        with self._queue_lock:
+            discarded = self._drain_queue()
+            # Stop before queueing, so the interruption cannot hit the
+            # urgent message itself
+            self.stop()
+            self._enqueue(sentences)
+
+        if discarded:
+            self._finish_items(discarded)
+            logger.info("Cleared %d items from speech queue", len(discarded))
+
+        if not self._queue_active:
+            self._start_queue_processor()
+
+    @staticmethod
+    def _prepare(text: str) -> List[str]:
+        """
+        Split text into the sentences to queue, rejecting empty text.
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            Sentences to queue (empty if there is nothing to say)
+        """
+        if not text or not text.strip():
+            logger.warning("Attempted to speak empty text")
+            return []
+
+        # Long text is queued sentence by sentence, so speech starts after
+        # the first sentence rather than after the whole text is processed
+        sentences = _split_sentences(text)
+        if not sentences:
+            logger.warning("Attempted to speak text with nothing to say")
+        return sentences
+
+    def _enqueue(self, sentences: List[str]) -> threading.Event:
+        """
+        Hand sentences to the speech worker. Caller holds _queue_lock.
+
+        Args:
+            sentences: Sentences to speak, in order
+
+        Returns:
+            Completion event of the last sentence
+        """
+        # Mark speech as pending before it is queued, so a
+        # wait_until_done() right after say() does not return early
+        with self._pending_lock:
+            if self._pending_speech == 0:
+                self._busy_generation += 1
+            self._pending_speech += len(sentences)
+            self._done.clear()
+
+        for sentence in sentences:
+            done_event = threading.Event()
+            self._speech_queue.append((sentence, done_event))
+        self._items_event.set()
+        return done_event
+
+    def _drain_queue(self) -> List[threading.Event]:
+        """
+        Remove every queued item. Caller holds _queue_lock.
+
+        Returns:
+            Completion events of the removed items, still to be finished
+        """
+        # The worker may still popleft() concurrently; each item ends up
+        # either here or with the worker, never both or neither
+        popleft = self._speech_queue.popleft
+        done_events = []
+        while True:
+            try:
+                item = popleft()
+            except IndexError:
+                break
+            if item is not None:
+                done_events.append(item[1])
+        return done_events
 
     # ========================================================================
     # SPEECH QUEUE MANAGEMENT
@@ -284,16 +790,12 @@ class Speaker:
         Args:
             text: Text to add to queue
         """
-        self._speech_queue.put(text)
-        logger.debug("Added to speech queue: '%s'", text[:50])
-
-        # Start queue processor if not already running
-        if not self._queue_active:
-            self._start_queue_processor()
+        self.say(text, block=False)
 
     def _start_queue_processor(self) -> None:
         """Start the background thread that processes the speech queue."""
         if self._queue_thread and self._queue_thread.is_alive():
+            self._queue_active = True
             return  # Already running
 
         self._queue_active = True
@@ -305,27 +807,59 @@ class Speaker:
         self._queue_thread.start()
         logger.info("Speech queue processor started")
 
+    @staticmethod
+    def _pin_worker() -> None:
+        """Pin the calling thread to config.SPEECH_CPU, if one is set."""
+        if config.SPEECH_CPU < 0 or not hasattr(os, "sched_setaffinity"):
+            return
+
+        try:
+            # On Linux, pid 0 means the calling thread, not the process
+            os.sched_setaffinity(0, {config.SPEECH_CPU})
+            logger.info("Speech worker pinned to CPU %d", config.SPEECH_CPU)
+        except OSError as exc:
+            logger.warning("Could not pin speech worker to CPU %d: %s",
+                           config.SPEECH_CPU, exc)
+
     def _process_queue(self) -> None:
-        """Process queued speech items sequentially."""
+        """Speak queued items one after another (speech worker thread)."""
+        self._pin_worker()
+
         while self._queue_active:
+            # Sleep until there is something to say; stop_queue_processor()
+            # wakes the thread with a None sentinel
+            self._items_event.wait()
+            # Read before popping: a stop() from here on is meant for this item
+            stops = self._stop_count
             try:
-                # Get next item with timeout
-                text = self._speech_queue.get(timeout=1.0)
-
-                # Wait for any current speech to finish
-                while self.is_speaking():
-                    time.sleep(0.1)
+                item = self._speech_queue.popleft()
+            except IndexError:
+                self._items_event.clear()
+                # An item appended just before clear() must not be missed
+                if self._speech_queue:
+                    self._items_event.set()
+                continue
 
-                # Speak the queued text
-                self.say(text, block=True)
+            if item is None:
+                continue
 
-                self._speech_queue.task_done()
+            # Without the cache, waiting sentences are spoken together in
+            # one engine run; the cap keeps stop() and clear_queue() prompt
+            batch = [item]
+            if self._cache is None:
+                while len(batch) < MAX_SPEECH_BATCH:
+                    try:
+                        item = self._speech_queue.popleft()
+                    except IndexError:
+                        break
+                    if item is None:
+                        break
+                    batch.append(item)
 
-            except queue.Empty:
-                # No items in queue, continue waiting
-                continue
-            except Exception as exc:
-                logger.error("Queue processor error: %s", exc)
+            try:
+                self._speak([text for text, _ in batch], stops)
+            finally:
+                self._finish_items([done_event for _, done_event in batch])
 
     def clear_queue(self) -> int:
         """
@@ -334,15 +868,13 @@ class Speaker:
         Returns:
             Number of items cleared
         """
-        count = 0
-        while not self._speech_queue.empty():
-            try:
-                self._speech_queue.get_nowait()
-                count += 1
-            except queue.Empty:
-                break
+        with self._queue_lock:
+            done_events = self._drain_queue()
 
+        count = len(done_events)
         if count > 0:
+            # Settle all of them under one lock acquisition
+            self._finish_items(done_events)
             logger.info("Cleared %d items from speech queue", count)
 
         return count
@@ -350,6 +882,8 @@ class Speaker:
     def stop_queue_processor(self) -> None:
         """Stop the background queue processor thread."""
         self._queue_active = False
+        self._speech_queue.append(None)  # Wake the worker so it can exit
+        self._items_event.set()
         if self._queue_thread:
             self._queue_thread.join(timeout=2.0)
         logger.info("Speech queue processor stopped")
@@ -361,11 +895,24 @@ class Speaker:
         """
         Stop the current speech immediately.
 
-        Interrupts any ongoing speech. Does not affect queued items.
+        Interrupts any ongoing speech, and cancels an item the worker has
+        taken from the queue but not started yet. Does not affect queued
+        items. The engine is left alone when idle, since engine.stop() would
+        only cost a round-trip to the TTS driver.
         """
+        # Counted even when idle: the worker may have popped an item that it
+        # has not started speaking yet, and must drop it (see _speak)
+        self._stop_count += 1
+
+        if not self._speaking_flag:
+            return
+
         try:
+            play_obj = self._play_obj
+            if play_obj is not None:
+                play_obj.stop()
             self.engine.stop()
-            self._speaking.clear()
+            self._speaking_flag = False
             self._current_text = None
             logger.info("Speech stopped")
         except Exception as exc:
@@ -378,22 +925,48 @@ class Speaker:
         Returns:
             True if speech is in progress, False otherwise
         """
-        return self._speaking.is_set()
+        return self._speaking_flag
+
+    def is_busy(self) -> bool:
+        """
+        Check if any speech is queued or in progress.
+
+        Unlike is_speaking(), this stays True between queued sentences and
+        while audio is still being synthesized, so it is the right check
+        for muting the microphone.
+
+        Returns:
+            True until every pending say() has finished, False otherwise
+        """
+        return not self._done.is_set()
+
+    def busy_generation(self) -> int:
+        """
+        Count the busy periods so far.
+
+        Goes up by one each time speech is queued while the speaker is idle.
+        Comparing two readings tells whether speech started in between, even
+        if it has already finished.
+
+        Returns:
+            Number of times the speaker has gone from idle to busy
+        """
+        return self._busy_generation
 
     def wait_until_done(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for current speech to complete.
 
+        Blocks on an event set when the last pending say() finishes, so the
+        caller wakes as soon as speech ends instead of polling.
+
         Args:
             timeout: Maximum seconds to wait. None = wait indefinitely
 
         Returns:
             True if speech completed, False if timeout occurred
         """
-        if not self.is_speaking():
-            return True
-
-        return self._speaking.wait(timeout=timeout)
+        return self._done.wait(timeout=timeout)
 
     def get_current_text(self) -> Optional[str]:
         """
@@ -414,14 +987,19 @@ class Speaker:
         Returns:
             Dictionary with usage statistics
         """
+        with self._stats_lock:
+            total_utterances = self.total_utterances
+            total_characters = self.total_characters
+
         return {
-            "total_utterances": self.total_utterances,
-            "total_characters": self.total_characters,
+            "total_utterances": total_utterances,
+            "total_characters": total_characters,
             "currently_speaking": self.is_speaking(),
-            "queue_size": self._speech_queue.qsize(),
+            "queue_size": len(self._speech_queue),
             "queue_active": self._queue_active,
-            "current_rate": self.engine.getProperty("rate"),
-            "current_volume": self.engine.getProperty("volume")
+            "current_rate": self._rate,
+            "current_volume": self._volume,
+            "cache_hits": self._cache.hits if self._cache else 0
         }
 
     def print_stats(self) -> None:
@@ -442,7 +1020,7 @@ class Speaker:
         Stops all speech, clears queue, and releases resources.
         """
         logger.info("Shutting down speaker")
-        self.stop()
+        self.stop()  # No-op unless something is being spoken
         self.stop_queue_processor()
         self.clear_queue()
 
@@ -4,9 +4,12 @@ Test script for Jarvis AI Assistant
 Tests individual components to ensure they work correctly
 """
 
+import io
 import sys
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Import Jarvis components
@@ -16,6 +19,33 @@ from listen import Listener
 from speak import Speaker
 import skills
 
+class ThreadOutput:
+    """sys.stdout stand-in that buffers each test thread's prints separately"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def run(self, test_name, test_func):
+        """Run one test, returning (test_name, result, captured output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            result = test_func()
+        except Exception as e:
+            print(f"[FAIL] {test_name} crashed: {e}")
+            result = False
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+        return test_name, result, output
+
 def setup_logging():
     """Setup logging for tests"""
     logging.basicConfig(
@@ -58,6 +88,40 @@ def test_brain():
         print(f"[FAIL] Brain error: {e}")
         return False
 
+def test_history_trim():
+    """Test that the history summary survives trimming"""
+    print("\n[TEST] Testing history trimming...")
+    saved = (config.CONTEXT_TOKEN_BUDGET, config.ENABLE_HISTORY_SUMMARY,
+             config.ENABLE_HISTORY_ARCHIVE)
+    try:
+        # Budget small enough that the summary plus the remaining
+        # messages still exceed it after the older half is folded
+        config.CONTEXT_TOKEN_BUDGET = 200
+        config.ENABLE_HISTORY_SUMMARY = True
+        config.ENABLE_HISTORY_ARCHIVE = False
+
+        brain = Brain(system_prompt="Test.")
+        for i in range(4):
+            brain._append_message("user" if i % 2 == 0 else "assistant",
+                                  f"Message {i}. " + "word " * 80)
+        brain._trim_history()
+
+        history = list(brain.history)
+        summary_kept = brain._has_summary()
+        last_kept = history[-1]["content"].startswith("Message 3.")
+        print(f"[OK] History after trim: {len(history)} messages")
+        if not (summary_kept and last_kept):
+            print("[FAIL] Summary or latest message was trimmed")
+            return False
+        print("[OK] Summary pinned at the front of history")
+        return True
+    except Exception as e:
+        print(f"[FAIL] History trim error: {e}")
+        return False
+    finally:
+        (config.CONTEXT_TOKEN_BUDGET, config.ENABLE_HISTORY_SUMMARY,
+         config.ENABLE_HISTORY_ARCHIVE) = saved
+
 def test_speaker():
     """Test text-to-speech"""
     print("\n[TEST] Testing speaker...")
@@ -127,22 +191,38 @@ def main():
     
     setup_logging()
     
-    tests = [
+    # Config, Skills and Brain share nothing and mostly wait on I/O
+    # (Ollama), so they run in parallel. Speaker and Listener open the
+    # audio devices and History changes config values, so those run one
+    # at a time afterwards. Each test's output is printed as a block, in
+    # the order below, once all have finished
+    parallel_tests = [
         ("Configuration", test_config),
         ("Skills", test_skills),
+        ("Brain", test_brain),
+    ]
+    serial_tests = [
         ("Speaker", test_speaker),
         ("Listener", test_listener),
-        ("Brain", test_brain),
+        ("History", test_history_trim),
     ]
     
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(parallel_tests)) as executor:
+            futures = [executor.submit(output.run, test_name, test_func)
+                       for test_name, test_func in parallel_tests]
+            completed = [future.result() for future in futures]
+        completed += [output.run(test_name, test_func)
+                      for test_name, test_func in serial_tests]
+    finally:
+        sys.stdout = output.stream
+
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"[FAIL] {test_name} crashed: {e}")
-            results.append((test_name, False))
+    for test_name, result, text in completed:
+        sys.stdout.write(text)
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "=" * 60)